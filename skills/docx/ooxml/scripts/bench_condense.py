@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark pack.py's streaming XML condenser against the minidom one.
+
+Usage:
+    python bench_condense.py                  # 2 MB and 20 MB parts
+    python bench_condense.py --sizes 5 --dom-max-mb 5
+
+Generates a pretty-printed document.xml of each size, as unpack.py would
+leave it, and reports the time and peak traced memory of condensing it.
+The minidom condenser slows down quadratically on wide bodies, so it only
+runs on parts up to --dom-max-mb; where both run, their output must match.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from pack import _condense_xml_dom, condense_xml_content
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+PARAGRAPH = """    <w:p w:rsidR="00AB12CD">
+      <w:r>
+        <w:rPr>
+          <w:b/>
+        </w:rPr>
+        <w:t xml:space="preserve">Paragraph {} with some text </w:t>
+      </w:r>
+    </w:p>
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the streaming and minidom XML condensers"
+    )
+    parser.add_argument(
+        "--sizes", type=float, nargs="+", default=[2, 20], help="Part sizes in MB"
+    )
+    parser.add_argument(
+        "--dom-max-mb",
+        type=float,
+        default=4,
+        help="Largest part to run the minidom condenser on (default: 4)",
+    )
+    args = parser.parse_args()
+
+    mismatched = False
+    for size in args.sizes:
+        content = make_document(int(size * 1_000_000))
+        print(f"{len(content) / 1e6:.1f} MB document.xml")
+
+        output, seconds, peak = measure(condense_xml_content, content)
+        print(f"  streaming: {seconds:7.2f}s, peak {peak / 1e6:6.1f} MB")
+
+        if size > args.dom_max_mb:
+            print(f"  minidom:   skipped (over --dom-max-mb {args.dom_max_mb:g})")
+            continue
+        dom_output, seconds, peak = measure(_condense_xml_dom, content)
+        print(f"  minidom:   {seconds:7.2f}s, peak {peak / 1e6:6.1f} MB")
+        if dom_output != output:
+            print("  FAILED - outputs differ")
+            mismatched = True
+
+    if mismatched:
+        sys.exit(1)
+
+
+def make_document(size):
+    """Build a pretty-printed document.xml of about size bytes."""
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n',
+        f'<w:document xmlns:w="{W_NS}">\n  <w:body>\n',
+    ]
+    length = sum(map(len, parts))
+    i = 0
+    while length < size:
+        paragraph = PARAGRAPH.format(i)
+        parts.append(paragraph)
+        length += len(paragraph)
+        i += 1
+    parts.append("  </w:body>\n</w:document>\n")
+    return "".join(parts).encode("utf-8")
+
+
+def measure(condense, content):
+    """Run condense on content; returns (output, seconds, peak traced bytes).
+
+    Tracing slows allocation-heavy code down, so time and memory are measured
+    in separate runs.
+    """
+    start = time.perf_counter()
+    output = condense(content)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    condense(content)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return output, seconds, peak
+
+
+if __name__ == "__main__":
+    main()
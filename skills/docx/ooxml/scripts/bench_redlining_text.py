@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark RedliningValidator's text extraction on heavily redlined documents.
+
+Usage:
+    python bench_redlining_text.py
+    python bench_redlining_text.py --changes 100000
+
+Builds two document.xml trees with --changes tracked changes by Claude (half
+w:del, half w:ins): one with a w:del and a w:ins in each of many paragraphs,
+and one with a few very wide paragraphs. Each tree is timed through
+_extract_text_content, with and without change stats, and through the
+previous implementation, which stripped the changes in two walks (unwrapping
+each w:del with list(parent).index) before extracting the text. Both must
+produce the same text.
+"""
+
+import argparse
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+from validation.redlining import RedliningValidator
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+WIDE_PARAGRAPHS = 10
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time text extraction with tracked changes removed"
+    )
+    parser.add_argument("--changes", type=int, default=50_000)
+    args = parser.parse_args()
+
+    # Only _extract_text_content is used, so neither package is ever read
+    validator = RedliningValidator(".", "unused.docx")
+    pairs = args.changes // 2
+    wide = pairs // WIDE_PARAGRAPHS
+    shapes = {
+        f"{pairs} paragraphs, 1 w:del + 1 w:ins each": make_document(pairs, 1),
+        f"{WIDE_PARAGRAPHS} paragraphs, {wide} w:del + {wide} w:ins each": (
+            make_document(WIDE_PARAGRAPHS, wide)
+        ),
+    }
+
+    mismatched = False
+    for name, xml in shapes.items():
+        print(name)
+        root = ET.fromstring(xml)
+        text, seconds = timed(validator._extract_text_content, root)
+        print(f"  single walk:         {seconds:7.2f}s")
+        _, seconds = timed(validator._extract_text_content, root, {})
+        print(f"  single walk + stats: {seconds:7.2f}s")
+
+        root = ET.fromstring(xml)
+        previous_text, seconds = timed(extract_text_previous, root)
+        print(f"  previous:            {seconds:7.2f}s")
+        if previous_text != text:
+            print("  FAILED - extracted text differs")
+            mismatched = True
+
+    if mismatched:
+        sys.exit(1)
+
+
+def make_document(paragraphs, pairs_per_paragraph):
+    """Build document.xml with a w:del and a w:ins by Claude per pair."""
+    runs = []
+    for j in range(pairs_per_paragraph):
+        runs.append(
+            f"<w:r><w:t>word {j} </w:t></w:r>"
+            f'<w:del w:author="Claude"><w:r><w:delText>old {j}</w:delText></w:r></w:del>'
+            f'<w:ins w:author="Claude"><w:r><w:t>new {j}</w:t></w:r></w:ins>'
+        )
+    paragraph = f"<w:p>{''.join(runs)}</w:p>"
+    return (
+        f'<w:document xmlns:w="{W_NS}"><w:body>'
+        f"{paragraph * paragraphs}</w:body></w:document>"
+    )
+
+
+def timed(function, *args):
+    """Call function(*args); returns (result, seconds)."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def extract_text_previous(root):
+    """The previous _remove_claude_tracked_changes + _extract_text_content.
+
+    Kept here for comparison only. root is modified.
+    """
+    w = f"{{{W_NS}}}"
+    author_attr = f"{w}author"
+
+    for parent in root.iter():
+        to_remove = [
+            child
+            for child in parent
+            if child.tag == f"{w}ins" and child.get(author_attr) == "Claude"
+        ]
+        for elem in to_remove:
+            parent.remove(elem)
+
+    for parent in root.iter():
+        to_process = []
+        for child in parent:
+            if child.tag == f"{w}del" and child.get(author_attr) == "Claude":
+                to_process.append((child, list(parent).index(child)))
+        for del_elem, del_index in reversed(to_process):
+            for elem in del_elem.iter():
+                if elem.tag == f"{w}delText":
+                    elem.tag = f"{w}t"
+            for child in reversed(list(del_elem)):
+                parent.insert(del_index, child)
+            parent.remove(del_elem)
+
+    paragraphs = []
+    for p_elem in root.findall(f".//{w}p"):
+        text = "".join(t.text for t in p_elem.findall(f".//{w}t") if t.text)
+        if text:
+            paragraphs.append(text)
+    return "\n".join(paragraphs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-part preprocessing that runs before XSD validation.
+
+Usage:
+    python bench_xsd_preprocess.py                     # synthetic word/document.xml
+    python bench_xsd_preprocess.py --paragraphs 100000
+    python bench_xsd_preprocess.py --docx file.docx    # every XML part of a file
+
+Each part is preprocessed three ways, best of --repeat runs:
+  previous  the earlier three steps, each making its own tostring/fromstring
+            copy (template tags, then mc:Ignorable, then foreign namespaces)
+  copy      _preprocess_for_xsd on a deep copy, as for cached trees
+  in place  _preprocess_for_xsd with owned=True, as in streaming mode
+All three must give the same serialized tree.
+"""
+
+import argparse
+import io
+import re
+import sys
+import time
+import zipfile
+from pathlib import PurePosixPath
+
+import lxml.etree
+
+from validation.docx import DOCXSchemaValidator
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NS = "http://schemas.microsoft.com/office/word/2010/wordml"
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+PARAGRAPH = (
+    '<w:p w14:paraId="{0:08X}" w14:textId="77777777" w:rsidR="00AB12CD">'
+    '<w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">Paragraph {0} </w:t></w:r>'
+    '<mc:AlternateContent><mc:Choice Requires="w14"><w14:checkbox/></mc:Choice>'
+    "<mc:Fallback><w:r><w:t>[ ]</w:t></w:r></mc:Fallback></mc:AlternateContent>"
+    '<w:bookmarkStart w:id="{0}" w:name="b{0}"/>{{{{field_{0}}}}}'
+    '<w:bookmarkEnd w:id="{0}"/></w:p>'
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time XSD preprocessing before and after the single-copy pass"
+    )
+    parser.add_argument("--docx", help="Measure every XML part of this file instead")
+    parser.add_argument("--paragraphs", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.docx:
+        with zipfile.ZipFile(args.docx) as zf:
+            parts = {
+                name: zf.read(name)
+                for name in zf.namelist()
+                if name.endswith((".xml", ".rels"))
+            }
+        unpacked_dir = args.docx
+    else:
+        parts = {"word/document.xml": make_document(args.paragraphs)}
+        # Only _preprocess_for_xsd is used, so neither package is ever read
+        unpacked_dir = "."
+    validator = DOCXSchemaValidator(unpacked_dir, "unused.docx")
+
+    print(f"{'part':<32} {'MB':>6} {'previous':>10} {'copy':>10} {'in place':>10}")
+    mismatched = False
+    for name, content in parts.items():
+        relative_path = PurePosixPath(name)
+        doc = lxml.etree.parse(io.BytesIO(content))
+
+        previous, previous_output = timed(
+            lambda: preprocess_previous(validator, doc, relative_path), args.repeat
+        )
+        copied, copy_output = timed(
+            lambda: validator._preprocess_for_xsd(doc, relative_path), args.repeat
+        )
+        owned = [lxml.etree.parse(io.BytesIO(content)) for _ in range(args.repeat)]
+        in_place, in_place_output = timed(
+            lambda: validator._preprocess_for_xsd(owned.pop(), relative_path, True),
+            args.repeat,
+        )
+        print(
+            f"{name:<32} {len(content) / 1e6:6.2f} {previous * 1000:8.1f}ms "
+            f"{copied * 1000:8.1f}ms {in_place * 1000:8.1f}ms"
+        )
+
+        expected = lxml.etree.tostring(previous_output)
+        if any(
+            lxml.etree.tostring(output) != expected
+            for output in (copy_output, in_place_output)
+        ):
+            print(f"  FAILED - {name}: preprocessed trees differ")
+            mismatched = True
+
+    if mismatched:
+        sys.exit(1)
+
+
+def make_document(paragraphs):
+    """Build a word/document.xml with w14 attributes, mc content and template tags."""
+    body = "".join(PARAGRAPH.format(i) for i in range(paragraphs))
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{W_NS}" xmlns:w14="{W14_NS}" xmlns:mc="{MC_NS}" '
+        f'mc:Ignorable="w14"><w:body>{body}</w:body></w:document>'
+    ).encode("utf-8")
+
+
+def timed(function, repeat):
+    """Best time of repeat calls; returns (seconds, result of the last call)."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def preprocess_previous(validator, xml_doc, relative_path):
+    """The preprocessing _preprocess_for_xsd replaced, kept here for comparison.
+
+    Only the template tag warnings, which nothing read, are left out.
+    """
+    template_pattern = re.compile(r"\{\{[^}]*\}\}")
+
+    # Template tags, on a tostring/fromstring copy
+    root = lxml.etree.fromstring(lxml.etree.tostring(xml_doc, encoding="unicode"))
+    for elem in root.iter():
+        if not hasattr(elem, "tag") or callable(elem.tag):
+            continue
+        tag = str(elem.tag)
+        if tag.endswith("}t") or tag == "t":
+            continue
+        if elem.text:
+            elem.text = template_pattern.sub("", elem.text)
+        if elem.tail:
+            elem.tail = template_pattern.sub("", elem.tail)
+
+    root.attrib.pop(f"{{{validator.MC_NAMESPACE}}}Ignorable", None)
+    if not (
+        relative_path.parts and relative_path.parts[0] in validator.MAIN_CONTENT_FOLDERS
+    ):
+        return lxml.etree.ElementTree(root)
+
+    # Foreign namespaces, on a second tostring/fromstring copy
+    root = lxml.etree.fromstring(lxml.etree.tostring(root, encoding="unicode"))
+    for elem in root.iter():
+        for attr in list(elem.attrib):
+            if "{" in attr and attr.split("}")[0][1:] not in validator.OOXML_NAMESPACES:
+                del elem.attrib[attr]
+
+    def remove_foreign_elements(parent):
+        to_remove = []
+        for elem in list(parent):
+            if not hasattr(elem, "tag") or callable(elem.tag):
+                continue
+            tag = str(elem.tag)
+            if tag.startswith("{") and tag.split("}")[0][1:] not in (
+                validator.OOXML_NAMESPACES
+            ):
+                to_remove.append(elem)
+                continue
+            remove_foreign_elements(elem)
+        for elem in to_remove:
+            parent.remove(elem)
+
+    remove_foreign_elements(root)
+    return lxml.etree.ElementTree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Check pack.py's XML condensing against the golden files in pack_golden/.
+
+Usage:
+    python check_pack_golden.py            # exit 1 if any output changed
+    python check_pack_golden.py --update   # rewrite the .condensed.xml files
+
+Each <case>.xml is condensed with condense_xml_content and must match
+<case>.condensed.xml byte for byte. Documents without a DOCTYPE are also run
+through the minidom condenser, which the streaming one must reproduce.
+<case>.forbidden.xml files declare or reference entities and must be
+rejected. Only use --update for an intended change to the packed output.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from defusedxml.common import DefusedXmlException
+
+from pack import _condense_xml_dom, condense_xml_content
+
+GOLDEN_DIR = Path(__file__).parent / "pack_golden"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check XML condensing against the pack_golden/ corpus"
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Rewrite the expected outputs from the current implementation",
+    )
+    args = parser.parse_args()
+
+    failures = check_golden(update=args.update)
+    for failure in failures:
+        print(f"FAILED - {failure}")
+    if failures:
+        sys.exit(1)
+    print("All pack golden files match")
+
+
+def check_golden(update=False):
+    """Condense every golden case and compare it with its expected output.
+
+    Args:
+        update: If True, write the current output as the expected output
+
+    Returns:
+        list: One message per failing case
+    """
+    failures = []
+    for case in sorted(GOLDEN_DIR.glob("*.xml")):
+        if case.name.endswith(".condensed.xml"):
+            continue
+        content = case.read_bytes()
+
+        if case.name.endswith(".forbidden.xml"):
+            try:
+                condense_xml_content(content)
+            except DefusedXmlException:
+                continue
+            failures.append(f"{case.name}: entities were not rejected")
+            continue
+
+        output = condense_xml_content(content)
+        if b"<!DOCTYPE" not in content and output != _condense_xml_dom(content):
+            failures.append(f"{case.name}: differs from the minidom condenser")
+
+        expected_path = case.with_name(case.name[: -len(".xml")] + ".condensed.xml")
+        if update:
+            expected_path.write_bytes(output)
+        elif not expected_path.exists():
+            failures.append(f"{case.name}: no {expected_path.name} (run --update)")
+        elif output != expected_path.read_bytes():
+            failures.append(f"{case.name}: output differs from {expected_path.name}")
+    return failures
+
+
+if __name__ == "__main__":
+    main()
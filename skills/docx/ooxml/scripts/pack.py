@@ -7,25 +7,54 @@ Example usage:
 """
 
 import argparse
-import shutil
 import subprocess
 import sys
 import tempfile
 import defusedxml.minidom
+import xml.parsers.expat
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from defusedxml.common import EntitiesForbidden, ExternalReferenceForbidden
+
+# Already-compressed formats are stored as-is; deflating them again only costs time
+STORED_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".emz",
+    ".wmz",
+    ".wdp",
+    ".mp3",
+    ".mp4",
+    ".m4a",
+}
+
+# XML parts at least this large are condensed in worker processes
+PARALLEL_CONDENSE_BYTES = 1024 * 1024
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes for condensing large XML parts (default: CPU count)",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            workers=args.workers,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +71,18 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, workers=None):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    XML parts are condensed in memory and written straight into the archive;
+    the input directory is never copied or modified. Large parts are condensed
+    on a process pool, and already-compressed media is stored uncompressed.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        workers: Processes for condensing large XML parts (default: CPU count, 1 disables)
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,32 +95,58 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
+    files = [f for f in input_dir.rglob("*") if f.is_file()]
+    large_parts = [
+        f
+        for f in files
+        if _is_xml_part(f) and f.stat().st_size >= PARALLEL_CONDENSE_BYTES
+    ]
 
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
+    # Condense large parts in the background while the rest is written
+    pool = None
+    futures = {}
+    if workers != 1 and len(large_parts) > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        futures = {f: pool.submit(_condense_part, f) for f in large_parts}
 
+    try:
         # Create final Office file as zip archive
         output_file.parent.mkdir(parents=True, exist_ok=True)
         with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+            for f in files:
+                arcname = f.relative_to(input_dir).as_posix()
+                if _is_xml_part(f):
+                    # Remove pretty-printing whitespace
+                    content = futures[f].result() if f in futures else _condense_part(f)
+                    zinfo = zipfile.ZipInfo.from_file(f, arcname)
+                    zf.writestr(zinfo, content, compress_type=zipfile.ZIP_DEFLATED)
+                elif f.suffix.lower() in STORED_EXTENSIONS:
+                    zf.write(f, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zf.write(f, arcname)
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
+def _is_xml_part(path):
+    """Check whether a package file is an XML part that gets condensed."""
+    return path.name.endswith((".xml", ".rels"))
+
+
+def _condense_part(path):
+    """Read and condense a single XML part (runs in worker processes)."""
+    return condense_xml_content(Path(path).read_bytes())
+
+
 def validate_document(doc_path):
     """Validate document by converting to HTML with soffice."""
     # Determine the correct filter based on file extension
@@ -132,8 +192,157 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
+    xml_file = Path(xml_file)
+    xml_file.write_bytes(condense_xml_content(xml_file.read_bytes()))
+
+
+def condense_xml_content(content):
+    """Strip unnecessary whitespace and remove comments from XML bytes.
+
+    Streams the document through expat instead of building a DOM. The output
+    is the same as serializing the condensed minidom tree: whitespace-only text
+    and comments are dropped except directly inside *:t elements. Documents
+    with a DOCTYPE fall back to the DOM implementation.
+
+    Args:
+        content: XML document as bytes
+
+    Returns:
+        bytes: Condensed UTF-8 encoded XML
+    """
+    out = ['<?xml version="1.0" encoding="UTF-8"?>']
+    stack = []  # [tag, keeps_whitespace, has_children] for each open element
+    text = []
+    cdata = None
+    ns_decls = []
+
+    def write_child(markup):
+        # Close the parent's start tag before its first child
+        if stack and not stack[-1][2]:
+            out.append(">")
+            stack[-1][2] = True
+        out.append(markup)
+
+    def flush_text():
+        if not text:
+            return
+        data = "".join(text)
+        text.clear()
+        if data.strip() or stack[-1][1]:
+            write_child(_escape_xml(data))
+
+    def start_namespace_decl(prefix, uri):
+        ns_decls.append((prefix, uri))
+
+    def start_element(name, attrs):
+        flush_text()
+        tag = _qualified_name(name)
+        # minidom puts namespace declarations before the other attributes
+        markup = [f"<{tag}"]
+        for prefix, uri in ns_decls:
+            attr_name = f"xmlns:{prefix}" if prefix else "xmlns"
+            markup.append(f' {attr_name}="{_escape_xml(uri or "")}"')
+        ns_decls.clear()
+        for i in range(0, len(attrs), 2):
+            markup.append(f' {_qualified_name(attrs[i])}="{_escape_xml(attrs[i + 1])}"')
+        write_child("".join(markup))
+        stack.append([tag, tag.endswith(":t"), False])
+
+    def end_element(name):
+        flush_text()
+        tag, _, has_children = stack.pop()
+        out.append(f"</{tag}>" if has_children else "/>")
+
+    def character_data(data):
+        if cdata is not None:
+            cdata.append(data)
+        elif stack:
+            text.append(data)
+
+    def comment(data):
+        flush_text()
+        # Comments are only kept at document level and inside *:t elements
+        if not stack or stack[-1][1]:
+            write_child(f"<!--{data}-->")
+
+    def processing_instruction(target, data):
+        flush_text()
+        write_child(f"<?{target} {data}?>")
+
+    def start_cdata():
+        nonlocal cdata
+        cdata = []
+
+    def end_cdata():
+        nonlocal cdata
+        # An empty CDATA section creates no node, so text around it stays one run
+        if cdata:
+            flush_text()
+            write_child(f"<![CDATA[{''.join(cdata)}]]>")
+        cdata = None
+
+    def doctype(*args):
+        raise _DoctypeFound()
+
+    def entity_decl(name, is_parameter_entity, value, base, sysid, pubid, notation):
+        raise EntitiesForbidden(name, value, base, sysid, pubid, notation)
+
+    def unparsed_entity_decl(name, base, sysid, pubid, notation):
+        raise EntitiesForbidden(name, None, base, sysid, pubid, notation)
+
+    def external_entity_ref(context, base, sysid, pubid):
+        raise ExternalReferenceForbidden(context, base, sysid, pubid)
+
+    parser = xml.parsers.expat.ParserCreate(namespace_separator=" ")
+    parser.namespace_prefixes = True
+    parser.ordered_attributes = True
+    parser.buffer_text = True
+    parser.StartNamespaceDeclHandler = start_namespace_decl
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+    parser.CommentHandler = comment
+    parser.ProcessingInstructionHandler = processing_instruction
+    parser.StartCdataSectionHandler = start_cdata
+    parser.EndCdataSectionHandler = end_cdata
+    parser.StartDoctypeDeclHandler = doctype
+    parser.EntityDeclHandler = entity_decl
+    parser.UnparsedEntityDeclHandler = unparsed_entity_decl
+    parser.ExternalEntityRefHandler = external_entity_ref
+
+    try:
+        parser.Parse(content, True)
+    except _DoctypeFound:
+        return _condense_xml_dom(content)
+
+    return "".join(out).encode("utf-8")
+
+
+class _DoctypeFound(Exception):
+    """Raised by condense_xml_content to hand DOCTYPE documents to minidom."""
+
+
+def _qualified_name(expat_name):
+    """Turn expat's "uri local prefix" name into the prefixed name minidom uses."""
+    parts = expat_name.split(" ")
+    if len(parts) == 3:
+        return f"{parts[2]}:{parts[1]}"
+    return parts[-1]
+
+
+def _escape_xml(data):
+    """Escape text and attribute values exactly like minidom's serializer."""
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+def _condense_xml_dom(content):
+    """minidom-based condenser, used for documents with a DOCTYPE."""
+    dom = defusedxml.minidom.parseString(content)
 
     # Process each element to remove whitespace and comments
     for element in dom.getElementsByTagName("*"):
@@ -150,9 +359,7 @@ def condense_xml(xml_file):
             ) or child.nodeType == child.COMMENT_NODE:
                 element.removeChild(child)
 
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    return dom.toxml(encoding="UTF-8")
 
 
 if __name__ == "__main__":
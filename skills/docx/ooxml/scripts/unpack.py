@@ -1,29 +1,181 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Tool to unpack an Office file (.docx, .pptx, .xlsx) and pretty-print its XML contents.
 
+Example usage:
+    python unpack.py <office_file> <output_directory> [--only PATTERN ...] [--no-pretty]
+"""
+
+import argparse
+import fnmatch
 import random
+import shutil
 import sys
 import defusedxml.minidom
 import zipfile
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
+
+# XML parts at least this large are pretty-printed in worker processes
+PARALLEL_PRETTY_BYTES = 256 * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Unpack an Office file into a directory"
+    )
+    parser.add_argument("office_file", help="Office file to unpack (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_directory", help="Directory to extract into")
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        metavar="PATTERN",
+        help="Only extract members matching these globs (e.g. word/document.xml '*.rels')",
+    )
+    parser.add_argument(
+        "--no-pretty",
+        action="store_true",
+        help="Extract XML as-is instead of pretty-printing it",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes for pretty-printing large XML parts (default: CPU count)",
+    )
+    args = parser.parse_args()
+
+    try:
+        unpack_document(
+            args.office_file,
+            args.output_directory,
+            workers=args.workers,
+            pretty=not args.no_pretty,
+            only=args.only,
+        )
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.office_file.lower().endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(input_file, output_dir, *, workers=None, pretty=True, only=None):
+    """Unpack an Office file (.docx/.pptx/.xlsx) into a directory.
+
+    Every member is read from the archive once. Non-XML members are streamed
+    straight to disk; XML parts are pretty-printed as they are written, with
+    large parts handled on a process pool.
+
+    Args:
+        input_file: Path to the Office file
+        output_dir: Directory to extract into (created if missing)
+        workers: Processes for pretty-printing large XML parts (default: CPU count, 1 disables)
+        pretty: If False, XML parts are extracted unchanged
+        only: Optional list of glob patterns; only matching members are extracted
+
+    Returns:
+        list[str]: Names of the extracted members
+    """
+    input_file = Path(input_file)
+    output_path = Path(output_dir)
+
+    if not input_file.is_file():
+        raise ValueError(f"{input_file} is not a file")
+    if not zipfile.is_zipfile(input_file):
+        raise ValueError(f"{input_file} is not a valid Office file")
+
+    output_path.mkdir(parents=True, exist_ok=True)
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
+    with zipfile.ZipFile(input_file) as zf:
+        members = [
+            info
+            for info in zf.infolist()
+            if not info.is_dir()
+            and (not only or any(fnmatch.fnmatch(info.filename, p) for p in only))
+        ]
+        targets = {
+            info.filename: _member_path(output_path, info.filename) for info in members
+        }
 
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
+        xml_members = {
+            info.filename for info in members if pretty and _is_xml_part(info.filename)
+        }
+        large_parts = [
+            info
+            for info in members
+            if info.filename in xml_members and info.file_size >= PARALLEL_PRETTY_BYTES
+        ]
 
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
+        # Pretty-print large parts in the background while the rest is written
+        pool = None
+        futures = []
+        if workers != 1 and len(large_parts) > 1:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            for info in large_parts:
+                target = targets[info.filename]
+                target.parent.mkdir(parents=True, exist_ok=True)
+                futures.append(
+                    pool.submit(_unpack_xml_part, input_file, info.filename, target)
+                )
+        queued = {info.filename for info in large_parts} if pool else set()
+
+        try:
+            for info in members:
+                if info.filename in queued:
+                    continue
+                target = targets[info.filename]
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if info.filename in xml_members:
+                    target.write_bytes(pretty_xml_content(zf.read(info)))
+                else:
+                    with zf.open(info) as src, open(target, "wb") as dst:
+                        shutil.copyfileobj(src, dst)
+            for future in futures:
+                future.result()
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+
+    return [info.filename for info in members]
+
+
+def pretty_xml_content(content):
+    """Pretty-print XML bytes with two-space indentation.
+
+    Args:
+        content: XML document as bytes
+
+    Returns:
+        bytes: Indented, ASCII encoded XML
+    """
     dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
+    return dom.toprettyxml(indent="  ", encoding="ascii")
+
+
+def _unpack_xml_part(input_file, name, target):
+    """Read, pretty-print and write one XML part; runs in a worker process."""
+    with zipfile.ZipFile(input_file) as zf:
+        content = zf.read(name)
+    Path(target).write_bytes(pretty_xml_content(content))
+
+
+def _is_xml_part(name):
+    """Check whether an archive member is an XML part (includes _rels/.rels)."""
+    return name.endswith((".xml", ".rels"))
+
+
+def _member_path(output_path, name):
+    """Resolve where an archive member is written, rejecting paths outside output_path."""
+    # extractall used to sanitize such names and keep going; refusing the whole
+    # archive instead is deliberate, since a valid Office file never has them
+    parts = PurePosixPath(name.replace("\\", "/")).parts
+    if not parts or parts[0] == "/" or ".." in parts or ":" in parts[0]:
+        raise ValueError(f"Unsafe member path in archive: {name}")
+    return output_path.joinpath(*parts)
+
 
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+if __name__ == "__main__":
+    main()
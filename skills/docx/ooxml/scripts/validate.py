@@ -3,21 +3,37 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir or packed file> --original <original_file> [--format text|json|ndjson] [--streaming]
 """
 
 import argparse
+import contextlib
+import json
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    BaselinePackage,
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+    open_package,
+)
+
+# Main part of each document type, for originals given as bytes
+MAIN_PARTS = {
+    "word/document.xml": ".docx",
+    "ppt/presentation.xml": ".pptx",
+    "xl/workbook.xml": ".xlsx",
+}
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
-        help="Path to unpacked Office document directory",
+        help="Path to unpacked Office document directory (or the packed file)",
     )
     parser.add_argument(
         "--original",
@@ -30,39 +46,147 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "--author",
+        action="append",
+        dest="authors",
+        help="Author whose tracked changes are checked (repeatable, default: Claude)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for per-part XSD validation (default: 1, 0 uses all CPUs)",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream parts through the structural checks instead of keeping "
+        "parsed trees (bounded memory for very large parts); prints peak RSS",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json", "ndjson"],
+        default="text",
+        help="Report format on stdout: text (default), one JSON document, "
+        "or one JSON line per validator; with json/ndjson the text output goes to stderr",
+    )
     args = parser.parse_args()
 
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
     original_file = Path(args.original)
     file_extension = original_file.suffix.lower()
-    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
+    assert unpacked_dir.exists(), f"Error: {unpacked_dir} does not exist"
     assert original_file.is_file(), f"Error: {original_file} is not a file"
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
 
-    # Run validations
+    # Run validations; for JSON reports the human-readable output is moved to stderr
+    text_output = sys.stdout if args.format == "text" else sys.stderr
+    with contextlib.redirect_stdout(text_output):
+        try:
+            success, reports = validate_document(
+                unpacked_dir,
+                original_file,
+                verbose=args.verbose,
+                workers=args.workers or None,
+                authors=args.authors,
+                streaming=args.streaming,
+            )
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+        if success:
+            print("All validations PASSED!")
+        if args.streaming:
+            rss = max((r.peak_rss for r in reports if r.peak_rss), default=None)
+            if rss is not None:
+                print(f"Peak RSS: {rss / 2**20:.1f} MB")
+
+    if args.format == "json":
+        document = {
+            "unpacked_dir": str(unpacked_dir),
+            "original_file": str(original_file),
+            "passed": success,
+            "reports": [report.to_dict() for report in reports],
+        }
+        print(json.dumps(document, indent=2, ensure_ascii=False))
+    elif args.format == "ndjson":
+        for report in reports:
+            print(report.to_json())
+
+    sys.exit(0 if success else 1)
+
+
+def validate_document(
+    unpacked_dir,
+    original_file,
+    *,
+    verbose=False,
+    workers=1,
+    authors=None,
+    streaming=False,
+):
+    """Run every validator for the document type against one document.
+
+    Args:
+        unpacked_dir: Directory holding the unpacked document, or the packed
+            document as a path, bytes or package
+        original_file: Original .docx/.pptx file, its bytes, or a BaselinePackage of it
+        verbose: Print passing checks and timings as well
+        workers: Processes for per-part XSD validation (None: CPU count, 1: serial)
+        authors: Authors whose tracked changes are checked (default: Claude)
+        streaming: Run the structural checks over streamed parts, keeping no
+            parsed trees (see BaseSchemaValidator)
+
+    Returns:
+        tuple: (success, list of ValidationReport, one per validator)
+
+    Raises:
+        ValueError: If the document type is not supported
+    """
+    original = BaselinePackage.coerce(original_file)
+    package = open_package(unpacked_dir)
+    if original.path is not None:
+        file_extension = original.path.suffix.lower()
+    else:
+        # In-memory original: tell the type from its main part
+        file_extension = next(
+            (ext for part, ext in MAIN_PARTS.items() if part in original), ""
+        )
     match file_extension:
         case ".docx":
             validators = [DOCXSchemaValidator, RedliningValidator]
         case ".pptx":
             validators = [PPTXSchemaValidator]
         case _:
-            print(f"Error: Validation not supported for file type {file_extension}")
-            sys.exit(1)
+            raise ValueError(f"Validation not supported for file type {file_extension}")
 
-    # Run validators
+    # Run validators, sharing one view of the document and of the original file
     success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+    reports = []
+    try:
+        for V in validators:
+            options = {}
+            if issubclass(V, BaseSchemaValidator):
+                options["workers"] = workers
+                options["streaming"] = streaming
+            elif authors:
+                options["authors"] = authors
+            validator = V(package, original, verbose=verbose, **options)
+            if not validator.validate():
+                success = False
+            reports.append(validator.report)
+    finally:
+        if original is not original_file:
+            original.close()
+        if package is not unpacked_dir:
+            package.close()
 
-    if success:
-        print("All validations PASSED!")
-
-    sys.exit(0 if success else 1)
+    return success, reports
 
 
 if __name__ == "__main__":
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Command line tool to validate many Office documents on a pool of worker processes.
+
+Usage:
+    python validate_batch.py --manifest <pairs.csv|pairs.jsonl> [--jobs N] [--format text|ndjson] [--streaming]
+    python validate_batch.py --files '<glob>' [--originals <dir>] [--jobs N] [--format text|ndjson] [--streaming]
+
+A manifest lists unpacked_dir/original pairs, as CSV (with or without an
+"unpacked_dir,original" header) or as JSON lines with those two keys;
+relative paths are resolved against the manifest's directory. With --files,
+each matching .docx/.pptx is validated straight from the zip, against the
+same-named file in --originals, or against itself when no originals are
+given (only the checks that don't compare with an original can then fail).
+
+Each worker process keeps its compiled schemas for every document it
+validates. Results are printed as documents finish, followed by a throughput
+summary (on stderr with --format ndjson).
+"""
+
+import argparse
+import contextlib
+import csv
+import glob
+import io
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from validate import validate_document
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate many Office documents concurrently"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--manifest",
+        help="CSV or JSONL file of unpacked_dir/original pairs",
+    )
+    source.add_argument(
+        "--files",
+        nargs="+",
+        metavar="GLOB",
+        help="Packed .docx/.pptx files to validate (globs are expanded)",
+    )
+    parser.add_argument(
+        "--originals",
+        help="With --files: directory holding the original of each file under the same name",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--author",
+        action="append",
+        dest="authors",
+        help="Author whose tracked changes are checked (repeatable, default: Claude)",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream parts through the structural checks (bounded memory for very large parts)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "ndjson"],
+        default="text",
+        help="Per-document output: one line of text (default) or one JSON line",
+    )
+    args = parser.parse_args()
+
+    try:
+        if args.manifest:
+            jobs = read_manifest(args.manifest)
+        else:
+            jobs = find_files(args.files, args.originals)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Error: {e}")
+    if not jobs:
+        sys.exit("Error: No documents to validate")
+
+    summary_output = sys.stdout if args.format == "text" else sys.stderr
+    results = []
+    start = time.perf_counter()
+    for result in validate_batch(
+        jobs, workers=args.jobs, authors=args.authors, streaming=args.streaming
+    ):
+        results.append(result)
+        if args.format == "ndjson":
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+        else:
+            print(_format_result(result), flush=True)
+    elapsed = time.perf_counter() - start
+
+    print(_format_summary(results, elapsed), file=summary_output)
+    sys.exit(0 if all(result["passed"] for result in results) else 1)
+
+
+def read_manifest(manifest):
+    """Read (unpacked_dir, original) jobs from a CSV or JSONL manifest.
+
+    Relative paths are resolved against the manifest's directory.
+    """
+    manifest = Path(manifest)
+    base = manifest.parent
+    with open(manifest, newline="", encoding="utf-8") as f:
+        if manifest.suffix.lower() in (".jsonl", ".ndjson"):
+            rows = []
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    rows.append((entry["unpacked_dir"], entry["original"]))
+                except (ValueError, KeyError, TypeError) as e:
+                    raise ValueError(
+                        f"{manifest}:{line_number}: expected a JSON object with "
+                        f"unpacked_dir and original ({type(e).__name__}: {e})"
+                    ) from None
+        else:
+            rows = [tuple(row[:2]) for row in csv.reader(f) if row]
+            if rows and rows[0] == ("unpacked_dir", "original"):
+                rows = rows[1:]
+
+    jobs = []
+    for row in rows:
+        if len(row) != 2:
+            raise ValueError(
+                f"{manifest}: expected unpacked_dir,original but got {row}"
+            )
+        jobs.append((str(base / row[0]), str(base / row[1])))
+    return jobs
+
+
+def find_files(patterns, originals=None):
+    """Expand globs of packed documents into (packed_file, original) jobs."""
+    files = sorted(
+        {
+            Path(path)
+            for pattern in patterns
+            for path in glob.glob(pattern, recursive=True)
+            if path.lower().endswith((".docx", ".pptx"))
+        }
+    )
+    jobs = []
+    for packed in files:
+        original = Path(originals) / packed.name if originals else packed
+        jobs.append((str(packed), str(original)))
+    return jobs
+
+
+def validate_batch(jobs, *, workers=None, authors=None, streaming=False):
+    """Validate jobs on a process pool, yielding result dicts as documents finish.
+
+    Args:
+        jobs: Iterable of (document, original) pairs; the document is an
+            unpacked directory or a packed file
+        workers: Worker processes (default: CPU count)
+        authors: Authors whose tracked changes are checked (default: Claude)
+        streaming: Stream parts through the structural checks (see validate_document)
+
+    Yields:
+        dict: document, original_file,
+            passed, elapsed_ms, reports, output (the human-readable validator
+            output) and error (if validation could not run)
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_validate_job, document, original, authors, streaming)
+            for document, original in jobs
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _validate_job(document, original, authors, streaming=False):
+    """Validate one document in a worker process and return its result dict."""
+    start = time.perf_counter()
+    result = {
+        "document": document,
+        "original_file": original,
+        "passed": False,
+        "elapsed_ms": 0.0,
+        "reports": [],
+        "output": "",
+        "error": None,
+    }
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            if not Path(document).exists():
+                raise ValueError(f"{document} does not exist")
+            if not Path(original).is_file():
+                raise ValueError(f"{original} is not a file")
+            passed, reports = validate_document(
+                document, original, workers=1, authors=authors, streaming=streaming
+            )
+        result["passed"] = passed
+        result["reports"] = [report.to_dict() for report in reports]
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["output"] = output.getvalue()
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+def _format_result(result):
+    """One line per document: status, path, time and the failing checks."""
+    status = "PASSED" if result["passed"] else "FAILED"
+    line = f"{status} {result['document']} ({result['elapsed_ms']:.0f} ms)"
+    if result["error"]:
+        return f"{line}: {result['error']}"
+    failed = [
+        check["name"]
+        for report in result["reports"]
+        for check in report["checks"]
+        if check["status"] == "failed"
+    ]
+    return f"{line}: {', '.join(failed)}" if failed else line
+
+
+def _format_summary(results, elapsed):
+    """Totals, throughput and the checks that took the most time overall."""
+    passed = sum(result["passed"] for result in results)
+    errors = sum(result["error"] is not None for result in results)
+    check_ms = {}
+    peak_rss_mb = None
+    for result in results:
+        for report in result["reports"]:
+            for check in report["checks"]:
+                check_ms[check["name"]] = (
+                    check_ms.get(check["name"], 0.0) + check["elapsed_ms"]
+                )
+            if report.get("peak_rss_mb") is not None:
+                peak_rss_mb = max(peak_rss_mb or 0.0, report["peak_rss_mb"])
+
+    lines = [
+        "",
+        f"Validated {len(results)} documents in {elapsed:.2f} s "
+        f"({len(results) / elapsed:.1f} documents/s)",
+        f"  - Passed: {passed}",
+        f"  - Failed: {len(results) - passed - errors}",
+    ]
+    if errors:
+        lines.append(f"  - Could not be validated: {errors}")
+    if peak_rss_mb is not None:
+        lines.append(f"Peak RSS of the largest worker: {peak_rss_mb:.1f} MB")
+    if check_ms:
+        lines.append("Time per check (all documents):")
+        for name, ms in sorted(check_ms.items(), key=lambda item: -item[1])[:5]:
+            lines.append(f"  - {name}: {ms:.0f} ms")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    main()
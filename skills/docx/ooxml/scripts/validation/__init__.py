@@ -3,13 +3,23 @@ Validation modules for Word document processing.
 """
 
 from .base import BaseSchemaValidator
+from .baseline import BaselinePackage
 from .docx import DOCXSchemaValidator
+from .package import DirectoryPackage, OverlayPackage, ZipPackage, open_package
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
+from .report import CheckResult, ValidationReport
 
 __all__ = [
     "BaseSchemaValidator",
+    "BaselinePackage",
+    "CheckResult",
     "DOCXSchemaValidator",
+    "DirectoryPackage",
+    "OverlayPackage",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "ValidationReport",
+    "ZipPackage",
+    "open_package",
 ]
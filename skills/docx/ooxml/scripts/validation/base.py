@@ -2,11 +2,83 @@
 Base validator with common validation logic for document files.
 """
 
+import collections
+import copy
+import functools
+import hashlib
 import re
-from pathlib import Path
+import posixpath
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
 
 import lxml.etree
 
+from .baseline import BaselinePackage
+from .package import open_package
+from .report import CheckResult, ValidationReport, peak_rss
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(schema_path):
+    """Parse and compile an XSD schema, once per process.
+
+    Compiled schemas are shared by every validator instance, so a document
+    compiles each schema at most once no matter how many parts use it.
+
+    Args:
+        schema_path: Path to the .xsd file
+
+    Returns:
+        lxml.etree.XMLSchema: The compiled schema
+    """
+    with open(schema_path, "rb") as xsd_file:
+        parser = lxml.etree.XMLParser()
+        xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=str(schema_path))
+    return lxml.etree.XMLSchema(xsd_doc)
+
+
+# Placeholders for content replacement, removed from text before XSD validation
+TEMPLATE_TAG_PATTERN = re.compile(r"\{\{[^}]*\}\}")
+
+
+def iterparse_bounded(source):
+    """Stream (event, element) pairs for start and end tags with bounded memory.
+
+    Each element is cleared after its end event has been handled, and
+    finished siblings are unlinked, so only the path from the root to the
+    current element is kept. The root keeps its tag, attributes and
+    namespaces. source (a binary file object) is closed once read.
+    """
+    with source:
+        for event, elem in lxml.etree.iterparse(source, events=("start", "end")):
+            yield event, elem
+            if event == "end":
+                parent = elem.getparent()
+                if parent is None:
+                    continue
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+
+class PartScan:
+    """What one pass over a part's elements collected for the checks.
+
+    Checks read from here instead of walking the part themselves, so a part
+    is walked once however many checks look at it.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        # The root element; in streaming mode only its tag, attributes and
+        # namespaces are left
+        self.root = None
+        # Kind -> tuples describing each occurrence, in document order
+        self.found = collections.defaultdict(list)
+        # Kind -> number of occurrences
+        self.counts = collections.Counter()
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -68,7 +140,9 @@ class BaseSchemaValidator:
 
     # Unified namespace constants
     MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+    MC_ALTERNATE_CONTENT = f"{{{MC_NAMESPACE}}}AlternateContent"
     XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+    XML_SPACE_ATTRIBUTE = f"{{{XML_NAMESPACE}}}space"
 
     # Common OOXML namespaces used across validators
     PACKAGE_RELATIONSHIPS_NAMESPACE = (
@@ -80,6 +154,7 @@ class BaseSchemaValidator:
     CONTENT_TYPES_NAMESPACE = (
         "http://schemas.openxmlformats.org/package/2006/content-types"
     )
+    RELATIONSHIP_ID_ATTRIBUTE = f"{{{OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
 
     # Folders where we should clean ignorable namespaces
     MAIN_CONTENT_FOLDERS = {"word", "ppt", "xl"}
@@ -103,50 +178,232 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
-        self.unpacked_dir = Path(unpacked_dir).resolve()
-        self.original_file = Path(original_file)
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        workers=1,
+        xsd_cache=None,
+        streaming=False,
+    ):
+        # unpacked_dir may be a directory, a packed file, its bytes, or a package;
+        # parts are addressed by their name in the package (PurePosixPath)
+        self.package = open_package(unpacked_dir)
+        # original_file: a path, bytes, or a BaselinePackage shared across validators
+        self.original = BaselinePackage.coerce(original_file)
+        self.original_file = self.original.path
         self.verbose = verbose
+        # Processes for per-part XSD validation (None: CPU count, 1: serial)
+        self.workers = workers
+        # Optional dict kept by the caller across runs against the same original:
+        # (part name, content hash) -> XSD result, so unchanged parts are skipped
+        self.xsd_cache = xsd_cache
+        # Stream parts through iterparse for the structural checks and keep no
+        # parsed trees, bounding memory for very large parts. XSD validation
+        # still builds each part's tree, one part at a time.
+        self.streaming = streaming
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
         # Get all XML and .rels files
-        patterns = ["*.xml", "*.rels"]
         self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
+            PurePosixPath(name)
+            for suffix in (".xml", ".rels")
+            for name in self.package.names
+            if name.endswith(suffix)
         ]
 
         if not self.xml_files:
-            print(f"Warning: No XML files found in {self.unpacked_dir}")
+            print(f"Warning: No XML files found in {self.package.location}")
+
+        # Parsed trees (or parse errors) per file, shared by all checks
+        self._trees = {}
+        # PartScan (or the error that stopped it) per file
+        self._scans = {}
+        # Clark tag -> (local name, lowercased local name), for _scan_start
+        self._local_names = {}
+
+        # Structured results of the checks run through _run_check
+        self.report = ValidationReport(
+            type(self).__name__, self.package.location, self.original.location
+        )
+        self._check = None
 
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def _run_check(self, check):
+        """Run a validation check, adding its status, duration and errors to the report.
+
+        In verbose mode the duration is printed as well.
+        """
+        record = CheckResult(check.__name__)
+        self.report.checks.append(record)
+        self._check = record
+        start = time.perf_counter()
+        try:
+            result = check()
+        finally:
+            record.elapsed = time.perf_counter() - start
+            record.peak_rss = peak_rss()
+            self._check = None
+        record.status = {True: "passed", False: "failed"}.get(result, "info")
+        if self.verbose:
+            timing = f"{record.elapsed * 1000:.1f} ms"
+            if record.peak_rss is not None:
+                timing += f", peak RSS {record.peak_rss / 2**20:.1f} MB"
+            print(f"  [{record.name}: {timing}]")
+        return result
+
+    def _report_errors(self, summary, errors):
+        """Print a check's failure summary and errors, and add the errors to the report."""
+        print(summary)
+        for error in errors:
+            print(error)
+        if self._check is not None:
+            self._check.add_error_lines(errors)
+
+    def _glob_parts(self, pattern):
+        """Names of the parts matching a glob pattern such as "ppt/slides/*.xml"."""
+        return [
+            PurePosixPath(name)
+            for name in self.package.names
+            if PurePosixPath("/", name).match(f"/{pattern}")
+        ]
+
+    def _parse_xml(self, xml_file):
+        """Parse an XML part at most once per validator.
+
+        The cached tree is shared by every check and must not be modified.
+        Parse errors are cached as well and re-raised on every call. In
+        streaming mode trees are not kept, so each call parses the part again.
+        """
+        xml_file = PurePosixPath(xml_file)
+        self.report.count("parse", hit=xml_file in self._trees)
+        if xml_file in self._trees:
+            tree = self._trees[xml_file]
+            if isinstance(tree, Exception):
+                raise tree
+            return tree
+
+        try:
+            if self.streaming:
+                # Parsed from a stream: reading the part would cache its bytes
+                source = self.package.open(xml_file)
+                if source is None:
+                    raise FileNotFoundError(f"{xml_file} not found in package")
+                with source:
+                    tree = lxml.etree.parse(source)
+            else:
+                tree = self.package.parse(xml_file)
+            if tree is None:
+                raise FileNotFoundError(f"{xml_file} not found in package")
+        except Exception as e:
+            self._trees[xml_file] = e
+            raise
+        if not self.streaming:
+            self._trees[xml_file] = tree
+        return tree
+
+    def _scan_part(self, xml_file):
+        """Walk a part's elements once, collecting what the checks need.
+
+        The walk goes over the cached tree, or streams the part in streaming
+        mode. Subclasses collect more through _scan_start and _scan_end. The
+        scan, or the error that stopped it, is cached and returned (or
+        re-raised) on every call.
+        """
+        xml_file = PurePosixPath(xml_file)
+        self.report.count("scan", hit=xml_file in self._scans)
+        if xml_file not in self._scans:
+            scan = PartScan(xml_file)
+            # Clark tag -> number of open elements with that tag
+            open_tags = collections.Counter()
+            scan_start, scan_end = self._scan_start, self._scan_end
+            try:
+                for event, elem in self._iter_part(xml_file):
+                    tag = elem.tag
+                    if event == "start":
+                        if scan.root is None:
+                            scan.root = elem
+                        open_tags[tag] += 1
+                        scan_start(scan, elem, tag, open_tags)
+                    else:
+                        scan_end(scan, elem, tag, open_tags)
+                        open_tags[tag] -= 1
+                self._scans[xml_file] = scan
+            except Exception as e:
+                self._scans[xml_file] = e
+
+        scan = self._scans[xml_file]
+        if isinstance(scan, Exception):
+            raise scan
+        return scan
+
+    def _iter_part(self, xml_file):
+        """(event, element) pairs for the start and end tags of a part."""
+        if not self.streaming:
+            root = self._parse_xml(xml_file).getroot()
+            return lxml.etree.iterwalk(root, events=("start", "end"))
+        source = self.package.open(xml_file)
+        if source is None:
+            raise FileNotFoundError(f"{xml_file} not found in package")
+        return iterparse_bounded(source)
+
+    def _scan_start(self, scan, elem, tag, open_tags):
+        """Collect IDs and relationship references from an element's start tag.
+
+        tag is elem.tag; open_tags counts the open elements (this one
+        included) by Clark tag.
+        """
+        names = self._local_names.get(tag)
+        if names is None:
+            local_name = tag.split("}")[-1]
+            names = self._local_names[tag] = (local_name, local_name.lower())
+        local_name, id_tag = names
+
+        # IDs that must be unique; mc:AlternateContent is left out
+        if (
+            id_tag in self.UNIQUE_ID_REQUIREMENTS
+            and not open_tags[self.MC_ALTERNATE_CONTENT]
+        ):
+            attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[id_tag]
+            for attr, value in elem.attrib.items():
+                if attr.split("}")[-1].lower() == attr_name:
+                    scan.found["ids"].append(
+                        (id_tag, attr_name, scope, value, elem.sourceline)
+                    )
+                    break
+
+        rid = elem.get(self.RELATIONSHIP_ID_ATTRIBUTE)
+        if rid:
+            scan.found["relationship_ids"].append((local_name, rid, elem.sourceline))
+
+    def _scan_end(self, scan, elem, tag, open_tags):
+        """Collect from an element whose content has been read; the text is complete here."""
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
         for xml_file in self.xml_files:
             try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                # Try to parse the XML file; streaming reads it through once
+                # for all structural checks
+                if self.streaming:
+                    self._scan_part(xml_file)
+                else:
+                    self._parse_xml(xml_file)
             except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
+                errors.append(f"  {xml_file}: " f"Line {e.lineno}: {e.msg}")
             except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
-                )
+                errors.append(f"  {xml_file}: " f"Unexpected error: {str(e)}")
 
         if errors:
-            print(f"FAILED - Found {len(errors)} XML violations:")
-            for error in errors:
-                print(error)
+            self._report_errors(f"FAILED - Found {len(errors)} XML violations:", errors)
             return False
         else:
             if self.verbose:
@@ -159,7 +416,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._scan_part(xml_file).root
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -167,7 +424,7 @@ class BaseSchemaValidator:
                 ]:
                     undeclared = set(attr_val.split()) - declared
                     errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"  {xml_file}: "
                         f"Namespace '{ns}' in Ignorable but not declared"
                         for ns in undeclared
                     )
@@ -175,9 +432,7 @@ class BaseSchemaValidator:
                 continue
 
         if errors:
-            print(f"FAILED - {len(errors)} namespace issues:")
-            for error in errors:
-                print(error)
+            self._report_errors(f"FAILED - {len(errors)} namespace issues:", errors)
             return False
         if self.verbose:
             print("PASSED - All namespace prefixes properly declared")
@@ -190,84 +445,45 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
-
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
-                    )
+                # IDs outside mc:AlternateContent, in document order
+                ids = self._scan_part(xml_file).found["ids"]
+            except Exception as e:
+                errors.append(f"  {xml_file}: Error: {e}")
+                continue
 
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            file_ids = {}  # Track IDs that must be unique within this file
+            for tag, attr_name, scope, id_value, line in ids:
+                if scope == "global":
+                    # Check global uniqueness
+                    if id_value in global_ids:
+                        prev_file, prev_line, prev_tag = global_ids[id_value]
+                        errors.append(
+                            f"  {xml_file}: "
+                            f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                            f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                        )
+                    else:
+                        global_ids[id_value] = (xml_file, line, tag)
+                elif scope == "file":
+                    # Check file-level uniqueness
+                    key = (tag, attr_name)
+                    if key not in file_ids:
+                        file_ids[key] = {}
+
+                    if id_value in file_ids[key]:
+                        prev_line = file_ids[key][id_value]
+                        errors.append(
+                            f"  {xml_file}: "
+                            f"Line {line}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                            f"(first occurrence at line {prev_line})"
+                        )
+                    else:
+                        file_ids[key][id_value] = line
 
         if errors:
-            print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
-            for error in errors:
-                print(error)
+            self._report_errors(
+                f"FAILED - Found {len(errors)} ID uniqueness violations:", errors
+            )
             return False
         else:
             if self.verbose:
@@ -281,22 +497,21 @@ class BaseSchemaValidator:
         errors = []
 
         # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        rels_files = [f for f in self.xml_files if f.name.endswith(".rels")]
 
         if not rels_files:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        # Get all files in the unpacked directory (excluding reference files)
+        # Get all files in the package (excluding reference files)
         all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
+        for name in self.package.names:
+            file_path = PurePosixPath(name)
+            if file_path.name != "[Content_Types].xml" and not file_path.name.endswith(
+                ".rels"
             ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
+                all_files.append(file_path)
 
         # Track all files that are referenced by any .rels file
         all_referenced_files = set()
@@ -310,7 +525,7 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -329,8 +544,8 @@ class BaseSchemaValidator:
                     ):  # Skip external URLs
                         # Resolve the target path relative to the .rels file location
                         if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
+                            # Root .rels file - targets are relative to the package root
+                            target_path = PurePosixPath(target)
                         else:
                             # Other .rels files - targets are relative to their parent's parent
                             # e.g., word/_rels/document.xml.rels -> targets relative to word/
@@ -338,40 +553,33 @@ class BaseSchemaValidator:
                             target_path = base_dir / target
 
                         # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
+                        target_path = PurePosixPath(posixpath.normpath(target_path))
+                        if target_path in self.package:
+                            referenced_files.add(target_path)
+                            all_referenced_files.add(target_path)
+                        else:
                             broken_refs.append((target, rel.sourceline))
 
                 # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
+                for broken_ref, line_num in broken_refs:
+                    errors.append(
+                        f"  {rels_file}: Line {line_num}: Broken reference to {broken_ref}"
+                    )
 
             except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+                errors.append(f"  Error parsing {rels_file}: {e}")
 
         # Check for unreferenced files (files that exist but are not referenced anywhere)
         unreferenced_files = set(all_files) - all_referenced_files
 
         if unreferenced_files:
             for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+                errors.append(f"  Unreferenced file: {unref_file}")
 
         if errors:
-            print(f"FAILED - Found {len(errors)} relationship validation errors:")
-            for error in errors:
-                print(error)
+            self._report_errors(
+                f"FAILED - Found {len(errors)} relationship validation errors:", errors
+            )
             print(
                 "CRITICAL: These errors will cause the document to appear corrupt. "
                 + "Broken references MUST be fixed, "
@@ -406,12 +614,12 @@ class BaseSchemaValidator:
             rels_file = rels_dir / f"{xml_file.name}.rels"
 
             # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
+            if rels_file not in self.package:
                 continue
 
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
                 rid_to_type = {}
 
                 for rel in rels_root.findall(
@@ -422,9 +630,8 @@ class BaseSchemaValidator:
                     if rid:
                         # Check for duplicate rIds
                         if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
                             errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
+                                f"  {rels_file}: Line {rel.sourceline}: "
                                 f"Duplicate relationship ID '{rid}' (IDs must be unique)"
                             )
                         # Extract just the type name from the full URL
@@ -433,49 +640,38 @@ class BaseSchemaValidator:
                         )
                         rid_to_type[rid] = type_name
 
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
+                # All elements of the XML file with r:id attributes
+                references = self._scan_part(xml_file).found["relationship_ids"]
 
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
+                for elem_name, rid_attr, line in references:
+                    # Check if the ID exists
+                    if rid_attr not in rid_to_type:
+                        errors.append(
+                            f"  {xml_file}: Line {line}: "
+                            f"<{elem_name}> references non-existent relationship '{rid_attr}' "
+                            f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                        )
+                    # Check if we have type expectations for this element
+                    elif self.ELEMENT_RELATIONSHIP_TYPES:
+                        expected_type = self._get_expected_relationship_type(elem_name)
+                        if expected_type:
+                            actual_type = rid_to_type[rid_attr]
+                            # Check if the actual type matches or contains the expected type
+                            if expected_type not in actual_type.lower():
+                                errors.append(
+                                    f"  {xml_file}: Line {line}: "
+                                    f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                                    f"but should point to a '{expected_type}' relationship"
+                                )
 
             except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+                errors.append(f"  Error processing {xml_file}: {e}")
 
         if errors:
-            print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
-            for error in errors:
-                print(error)
+            self._report_errors(
+                f"FAILED - Found {len(errors)} relationship ID reference errors:",
+                errors,
+            )
             print("\nThese ID mismatches will cause the document to appear corrupt!")
             return False
         else:
@@ -524,14 +720,14 @@ class BaseSchemaValidator:
         errors = []
 
         # Find [Content_Types].xml file
-        content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        content_types_file = PurePosixPath("[Content_Types].xml")
+        if content_types_file not in self.package:
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse_xml(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -575,15 +771,12 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
+            # Get all files in the package
+            all_files = [PurePosixPath(name) for name in self.package.names]
 
             # Check all XML files for Override declarations
             for xml_file in self.xml_files:
-                path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
-                    "\\", "/"
-                )
+                path_str = str(xml_file)
 
                 # Skip non-content files
                 if any(
@@ -593,7 +786,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self._scan_part(xml_file).root.tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -618,18 +811,17 @@ class BaseSchemaValidator:
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
                         errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                            f'  {file_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
                         )
 
         except Exception as e:
             errors.append(f"  Error parsing [Content_Types].xml: {e}")
 
         if errors:
-            print(f"FAILED - Found {len(errors)} content type declaration errors:")
-            for error in errors:
-                print(error)
+            self._report_errors(
+                f"FAILED - Found {len(errors)} content type declaration errors:", errors
+            )
             return False
         else:
             if self.verbose:
@@ -642,20 +834,16 @@ class BaseSchemaValidator:
         """Validate a single XML file against XSD schema, comparing with original.
 
         Args:
-            xml_file: Path to XML file to validate
+            xml_file: Name of the XML part to validate (e.g. word/document.xml)
             verbose: Enable verbose output
 
         Returns:
             tuple: (is_valid, new_errors_set) where is_valid is True/False/None (skipped)
         """
-        # Resolve both paths to handle symlinks
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
+        xml_file = PurePosixPath(xml_file)
 
         # Validate current file
-        is_valid, current_errors = self._validate_single_file_xsd(
-            xml_file, unpacked_dir
-        )
+        is_valid, current_errors = self._validate_single_file_xsd(xml_file)
 
         if is_valid is None:
             return None, set()  # Skipped
@@ -671,9 +859,8 @@ class BaseSchemaValidator:
 
         if new_errors:
             if verbose:
-                relative_path = xml_file.relative_to(unpacked_dir)
-                print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                print(f"FAILED - {xml_file}: {len(new_errors)} new error(s)")
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -692,11 +879,10 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
-            relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
+        for xml_file, (is_valid, new_file_errors) in zip(
+            self.xml_files, self._validate_files_against_xsd()
+        ):
+            relative_path = str(xml_file)
 
             if is_valid is None:
                 skipped_count += 1
@@ -711,12 +897,23 @@ class BaseSchemaValidator:
                 continue
 
             # Has new errors
+            if self._check is not None:
+                for error in sorted(new_file_errors):
+                    self._check.add_error(error, file=relative_path)
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
 
+        if self._check is not None:
+            self._check.details.update(
+                files=len(self.xml_files),
+                valid=valid_count,
+                skipped=skipped_count,
+                with_original_errors=original_error_count,
+            )
+
         # Print summary
         if self.verbose:
             print(f"Validated {len(self.xml_files)} files:")
@@ -738,6 +935,72 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_files_against_xsd(self):
+        """Run validate_file_against_xsd for every XML file, in self.xml_files order.
+
+        Files whose content is already in xsd_cache reuse the stored result.
+        With more than one worker the rest are spread over a process pool; each
+        worker builds its own validator (and schema cache) once. Original-file
+        errors computed by the workers are merged into the shared baseline.
+        Packages with no source to reopen them from are validated serially.
+        """
+        results = {}
+        cache_keys = {}
+        pending = []
+        for xml_file in self.xml_files:
+            if self.xsd_cache is not None:
+                cache_keys[xml_file] = self._xsd_cache_key(xml_file)
+                hit = cache_keys[xml_file] in self.xsd_cache
+                self.report.count("xsd", hit=hit)
+                if hit:
+                    results[xml_file] = self.xsd_cache[cache_keys[xml_file]]
+                    continue
+            pending.append(xml_file)
+
+        # A package without a source (OverlayPackage) cannot be reopened by workers
+        if self.workers == 1 or len(pending) < 2 or self.package.source is None:
+            for xml_file in pending:
+                results[xml_file] = self.validate_file_against_xsd(
+                    xml_file, verbose=False
+                )
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_xsd_worker,
+                initargs=(
+                    type(self),
+                    self.package.source,
+                    self.original.source,
+                    self.streaming,
+                ),
+            ) as pool:
+                outcomes = pool.map(_validate_file_in_worker, pending)
+                for xml_file, (result, original_errors) in zip(pending, outcomes):
+                    self.original.xsd_errors.update(original_errors)
+                    results[xml_file] = result
+
+        if self.xsd_cache is not None:
+            for xml_file in pending:
+                self.xsd_cache[cache_keys[xml_file]] = results[xml_file]
+
+        return [results[xml_file] for xml_file in self.xml_files]
+
+    def _xsd_cache_key(self, xml_file):
+        """Key an XSD result by part name and content hash.
+
+        In streaming mode the part is hashed in chunks instead of being read
+        (and cached) whole.
+        """
+        if not self.streaming:
+            content = self.package.read(xml_file)
+            return str(xml_file), hashlib.sha1(content).hexdigest()
+
+        digest = hashlib.sha1()
+        with self.package.open(xml_file) as source:
+            for chunk in iter(lambda: source.read(1 << 20), b""):
+                digest.update(chunk)
+        return str(xml_file), digest.hexdigest()
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -762,96 +1025,119 @@ class BaseSchemaValidator:
 
         return None
 
-    def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+    def _preprocess_for_xsd(self, xml_doc, relative_path, owned=False):
+        """Prepare a parsed part for XSD validation, working on one copy at most.
 
-        # Remove attributes not in allowed namespaces
-        for elem in xml_copy.iter():
-            attrs_to_remove = []
+        Template tags ({{ ... }}) are removed from text outside w:t elements,
+        and mc:Ignorable from the root. In the main content folders,
+        attributes and elements from namespaces outside OOXML_NAMESPACES are
+        removed as well.
 
-            for attr in elem.attrib:
-                # Check if attribute is from a namespace other than allowed ones
-                if "{" in attr:
-                    ns = attr.split("}")[0][1:]
-                    if ns not in self.OOXML_NAMESPACES:
-                        attrs_to_remove.append(attr)
+        Args:
+            xml_doc: Parsed part
+            relative_path: Name of the part
+            owned: True if xml_doc may be modified in place; otherwise a deep
+                copy is preprocessed
 
-            # Remove collected attributes
-            for attr in attrs_to_remove:
-                del elem.attrib[attr]
+        Returns:
+            lxml.etree._ElementTree: The preprocessed tree
+        """
+        if not owned:
+            xml_doc = copy.deepcopy(xml_doc)
+        root = xml_doc.getroot()
 
-        # Remove elements not in allowed namespaces
-        self._remove_ignorable_elements(xml_copy)
+        # Remove mc:Ignorable attribute from root
+        root.attrib.pop(f"{{{self.MC_NAMESPACE}}}Ignorable", None)
+
+        if relative_path.parts and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS:
+            self._remove_foreign_namespaces(root)
+
+        # Template tags are placeholders for content replacement; w:t text
+        # (and tail) is left as is, as is the tail of comments and
+        # processing instructions
+        for text in root.xpath("//text()[contains(., '{{')]"):
+            parent = text.getparent()
+            tag = parent.tag
+            if not isinstance(tag, str) or tag.endswith("}t") or tag == "t":
+                continue
+            if text.is_tail:
+                parent.tail = TEMPLATE_TAG_PATTERN.sub("", parent.tail)
+            else:
+                parent.text = TEMPLATE_TAG_PATTERN.sub("", parent.text)
 
-        return lxml.etree.ElementTree(xml_copy)
+        return xml_doc
 
-    def _remove_ignorable_elements(self, root):
-        """Recursively remove all elements not in allowed namespaces."""
-        elements_to_remove = []
+    def _remove_foreign_namespaces(self, root):
+        """Remove attributes and elements not in allowed namespaces, below and on root.
 
-        # Find elements to remove
-        for elem in list(root):
+        root itself is kept whatever its namespace.
+        """
+        allowed = self.OOXML_NAMESPACES
+        # Clark name -> True if it is in a namespace that is not allowed
+        foreign_names = {}
+        foreign_elements = []
+
+        for elem in root.iter():
+            tag = elem.tag
             # Skip non-element nodes (comments, processing instructions, etc.)
-            if not hasattr(elem, "tag") or callable(elem.tag):
+            if not isinstance(tag, str):
                 continue
 
-            tag_str = str(elem.tag)
-            if tag_str.startswith("{"):
-                ns = tag_str.split("}")[0][1:]
-                if ns not in self.OOXML_NAMESPACES:
-                    elements_to_remove.append(elem)
-                    continue
-
-            # Recursively clean child elements
-            self._remove_ignorable_elements(elem)
-
-        # Remove collected elements
-        for elem in elements_to_remove:
-            root.remove(elem)
-
-    def _preprocess_for_mc_ignorable(self, xml_doc):
-        """Preprocess XML to handle mc:Ignorable attribute properly."""
-        # Remove mc:Ignorable attributes before validation
-        root = xml_doc.getroot()
+            foreign = foreign_names.get(tag)
+            if foreign is None:
+                foreign = foreign_names[tag] = (
+                    tag.startswith("{") and tag[1 : tag.index("}")] not in allowed
+                )
+            if foreign and elem is not root:
+                # Removed with its content, so there is no need to clean it
+                foreign_elements.append(elem)
+                continue
 
-        # Remove mc:Ignorable attribute from root
-        if f"{{{self.MC_NAMESPACE}}}Ignorable" in root.attrib:
-            del root.attrib[f"{{{self.MC_NAMESPACE}}}Ignorable"]
+            attrs_to_remove = []
+            for attr in elem.attrib:
+                foreign = foreign_names.get(attr)
+                if foreign is None:
+                    foreign = foreign_names[attr] = (
+                        attr.startswith("{")
+                        and attr[1 : attr.index("}")] not in allowed
+                    )
+                if foreign:
+                    attrs_to_remove.append(attr)
+            for attr in attrs_to_remove:
+                del elem.attrib[attr]
 
-        return xml_doc
+        for elem in foreign_elements:
+            elem.getparent().remove(elem)
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
+    def _validate_single_file_xsd(self, xml_file):
         """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            # Load XML (shared with the other checks, unless streaming)
+            xml_doc = self._parse_xml(xml_file)
+        except Exception as e:
+            return False, {str(e)}
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+        # In streaming mode the tree is not cached, so it can be preprocessed in place
+        return self._validate_xml_doc_xsd(
+            xml_doc, schema_path, xml_file, owned=self.streaming
+        )
 
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
-            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
+    def _validate_xml_doc_xsd(self, xml_doc, schema_path, relative_path, owned=False):
+        """Validate a parsed XML document against XSD schema. Returns (is_valid, errors_set).
 
-            # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
+        xml_doc is modified by preprocessing only if owned; otherwise
+        preprocessing works on a copy.
+        """
+        try:
+            # Load schema (compiled once per process)
+            schema = load_schema(schema_path.resolve())
+
+            # Preprocess XML
+            xml_doc = self._preprocess_for_xsd(xml_doc, relative_path, owned=owned)
 
             # Validate
             if schema.validate(xml_doc):
@@ -869,82 +1155,62 @@ class BaseSchemaValidator:
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        The member is read from the baseline package on demand; results are
+        cached on it, so each original part is validated at most once per run.
+
         Args:
-            xml_file: Path to the XML file in unpacked_dir to check
+            xml_file: Name of the XML part to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
-        # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
+        xml_file = PurePosixPath(xml_file)
+        name = str(xml_file)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
-
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
-
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        schema_path = self._get_schema_path(xml_file)
+        key = (schema_path, name)
+        self.report.count("original_xsd", hit=key in self.original.xsd_errors)
+        if key not in self.original.xsd_errors:
+            try:
+                original_doc = self.original.parse(name)
+            except Exception as e:
+                errors = {str(e)}
+            else:
+                if original_doc is None:
+                    # File didn't exist in original, so no original errors
+                    errors = set()
+                elif not schema_path:
+                    errors = set()
+                else:
+                    _, errors = self._validate_xml_doc_xsd(
+                        original_doc, schema_path, xml_file
+                    )
+            self.original.xsd_errors[key] = errors or set()
+        return self.original.xsd_errors[key]
 
-    def _remove_template_tags_from_text_nodes(self, xml_doc):
-        """Remove template tags from XML text nodes and collect warnings.
 
-        Template tags follow the pattern {{ ... }} and are used as placeholders
-        for content replacement. They should be removed from text content before
-        XSD validation while preserving XML structure.
+# Validator owned by each XSD worker process, set up by _init_xsd_worker
+_worker_validator = None
 
-        Returns:
-            tuple: (cleaned_xml_doc, warnings_list)
-        """
-        warnings = []
-        template_pattern = re.compile(r"\{\{[^}]*\}\}")
-
-        # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        def process_text_content(text, content_type):
-            if not text:
-                return text
-            matches = list(template_pattern.finditer(text))
-            if matches:
-                for match in matches:
-                    warnings.append(
-                        f"Found template tag in {content_type}: {match.group()}"
-                    )
-                return template_pattern.sub("", text)
-            return text
 
-        # Process all text nodes in the document
-        for elem in xml_copy.iter():
-            # Skip processing if this is a w:t element
-            if not hasattr(elem, "tag") or callable(elem.tag):
-                continue
-            tag_str = str(elem.tag)
-            if tag_str.endswith("}t") or tag_str == "t":
-                continue
+def _init_xsd_worker(validator_class, package_source, original_source, streaming):
+    """Create the validator used by this worker process."""
+    global _worker_validator
+    _worker_validator = validator_class(
+        package_source, original_source, streaming=streaming
+    )
 
-            elem.text = process_text_content(elem.text, "text content")
-            elem.tail = process_text_content(elem.tail, "tail content")
 
-        return lxml.etree.ElementTree(xml_copy), warnings
+def _validate_file_in_worker(xml_file):
+    """Validate one file in a worker; returns (result, original errors computed for it)."""
+    result = _worker_validator.validate_file_against_xsd(xml_file, verbose=False)
+    name = str(xml_file)
+    original_errors = {
+        key: errors
+        for key, errors in _worker_validator.original.xsd_errors.items()
+        if key[1] == name
+    }
+    return result, original_errors
 
 
 if __name__ == "__main__":
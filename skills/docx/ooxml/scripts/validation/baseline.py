@@ -0,0 +1,38 @@
+"""
+Lazily-populated view of the original Office file used as a validation baseline.
+"""
+
+from .package import ZipPackage
+
+
+class BaselinePackage(ZipPackage):
+    """Read-only view of the original package shared by the validators of one run.
+
+    Members are read from the zip only when first needed, and their bytes,
+    parsed trees and XSD error sets are cached for the lifetime of the view.
+    Pass the same instance to every validator to extract the original once.
+    The original may be a file path or the bytes of the file.
+    """
+
+    def __init__(self, original_file):
+        super().__init__(original_file)
+        self._trees = {}
+        # (schema_path, member name) -> set of XSD error messages
+        self.xsd_errors = {}
+
+    @classmethod
+    def coerce(cls, original):
+        """Return original if it is already a BaselinePackage, else wrap the path or bytes."""
+        return original if isinstance(original, cls) else cls(original)
+
+    def parse(self, name):
+        """Return the cached lxml tree of an XML member, or None if it does not exist.
+
+        The tree is shared between callers and must not be modified.
+        """
+        if name not in self._trees:
+            tree = super().parse(name)
+            if tree is None:
+                return None
+            self._trees[name] = tree
+        return self._trees[name]
@@ -3,12 +3,10 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
-from .base import BaseSchemaValidator
+from .base import BaseSchemaValidator, iterparse_bounded
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
@@ -16,6 +14,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
     # Word-specific namespace
     WORD_2006_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    W_T = f"{{{WORD_2006_NAMESPACE}}}t"
+    W_DEL_TEXT = f"{{{WORD_2006_NAMESPACE}}}delText"
+    W_P = f"{{{WORD_2006_NAMESPACE}}}p"
+    W_INS = f"{{{WORD_2006_NAMESPACE}}}ins"
+    W_DEL = f"{{{WORD_2006_NAMESPACE}}}del"
+    # Elements collected from document.xml by _scan_end
+    SCANNED_TAGS = frozenset({W_T, W_DEL_TEXT, W_P})
 
     # Word-specific element to relationship type mappings
     # Start with empty mapping - add specific cases as we discover them
@@ -24,51 +29,81 @@ class DOCXSchemaValidator(BaseSchemaValidator):
     def validate(self):
         """Run all validation checks and return True if all pass."""
         # Test 0: XML well-formedness
-        if not self.validate_xml():
+        if not self._run_check(self.validate_xml):
             return False
 
         # Test 1: Namespace declarations
         all_valid = True
-        if not self.validate_namespaces():
+        if not self._run_check(self.validate_namespaces):
             all_valid = False
 
         # Test 2: Unique IDs
-        if not self.validate_unique_ids():
+        if not self._run_check(self.validate_unique_ids):
             all_valid = False
 
         # Test 3: Relationship and file reference validation
-        if not self.validate_file_references():
+        if not self._run_check(self.validate_file_references):
             all_valid = False
 
         # Test 4: Content type declarations
-        if not self.validate_content_types():
+        if not self._run_check(self.validate_content_types):
             all_valid = False
 
         # Test 5: XSD schema validation
-        if not self.validate_against_xsd():
+        if not self._run_check(self.validate_against_xsd):
             all_valid = False
 
         # Test 6: Whitespace preservation
-        if not self.validate_whitespace_preservation():
+        if not self._run_check(self.validate_whitespace_preservation):
             all_valid = False
 
         # Test 7: Deletion validation
-        if not self.validate_deletions():
+        if not self._run_check(self.validate_deletions):
             all_valid = False
 
         # Test 8: Insertion validation
-        if not self.validate_insertions():
+        if not self._run_check(self.validate_insertions):
             all_valid = False
 
         # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
+        if not self._run_check(self.validate_all_relationship_ids):
             all_valid = False
 
         # Count and compare paragraphs
-        self.compare_paragraph_counts()
+        self._run_check(self.compare_paragraph_counts)
 
         return all_valid
 
+    def _scan_end(self, scan, elem, tag, open_tags):
+        """Collect the text runs and paragraphs of document.xml for the Word checks."""
+        super()._scan_end(scan, elem, tag, open_tags)
+        if tag not in self.SCANNED_TAGS:
+            return
+        if scan.name.name != "document.xml":
+            return
+
+        if tag == self.W_T:
+            text = elem.text
+            if text:
+                # Check if text starts or ends with whitespace
+                if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
+                    # Check if xml:space="preserve" attribute exists
+                    if elem.get(self.XML_SPACE_ATTRIBUTE) != "preserve":
+                        scan.found["unpreserved_whitespace"].append(
+                            (elem.sourceline, text)
+                        )
+                # w:t within w:del
+                if open_tags[self.W_DEL]:
+                    scan.found["deleted_text"].append((elem.sourceline, text))
+        elif tag == self.W_DEL_TEXT:
+            # w:delText within w:ins, unless nested within a w:del
+            if open_tags[self.W_INS] and not open_tags[self.W_DEL]:
+                scan.found["inserted_deleted_text"].append(
+                    (elem.sourceline, elem.text or "")
+                )
+        elif elem.getparent() is not None:
+            scan.counts["paragraphs"] += 1
+
     def validate_whitespace_preservation(self):
         """
         Validate that w:t elements with whitespace have xml:space='preserve'.
@@ -81,40 +116,31 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
+                # w:t elements with leading or trailing whitespace that is not
+                # preserved
+                found = self._scan_part(xml_file).found["unpreserved_whitespace"]
+                for line, text in found:
+                    # Show a preview of the text
+                    text_preview = (
+                        repr(text)[:50] + "..."
+                        if len(repr(text)) > 50
+                        else repr(text)
+                    )
+                    errors.append(
+                        f"  {xml_file}: "
+                        f"Line {line}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
+                    )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    f"  {xml_file}: Error: {e}"
                 )
 
         if errors:
-            print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
-            for error in errors:
-                print(error)
+            self._report_errors(
+                f"FAILED - Found {len(errors)} whitespace preservation violations:",
+                errors,
+            )
             return False
         else:
             if self.verbose:
@@ -134,36 +160,29 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements that are descendants of w:del elements
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-                xpath_expression = ".//w:del//w:t"
-                problematic_t_elements = root.xpath(
-                    xpath_expression, namespaces=namespaces
-                )
-                for t_elem in problematic_t_elements:
-                    if t_elem.text:
-                        # Show a preview of the text
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
+                # w:t elements with text that are descendants of w:del elements
+                found = self._scan_part(xml_file).found["deleted_text"]
+                for line, text in found:
+                    # Show a preview of the text
+                    text_preview = (
+                        repr(text)[:50] + "..."
+                        if len(repr(text)) > 50
+                        else repr(text)
+                    )
+                    errors.append(
+                        f"  {xml_file}: "
+                        f"Line {line}: <w:t> found within <w:del>: {text_preview}"
+                    )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    f"  {xml_file}: Error: {e}"
                 )
 
         if errors:
-            print(f"FAILED - Found {len(errors)} deletion validation violations:")
-            for error in errors:
-                print(error)
+            self._report_errors(
+                f"FAILED - Found {len(errors)} deletion validation violations:", errors
+            )
             return False
         else:
             if self.verbose:
@@ -180,10 +199,8 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
                 # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+                count = self._scan_part(xml_file).counts["paragraphs"]
             except Exception as e:
                 print(f"Error counting paragraphs in unpacked document: {e}")
 
@@ -194,19 +211,22 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
+            if self.streaming:
+                # Stream document.xml from the baseline package
+                source = self.original.open("word/document.xml")
+                count = sum(
+                    1
+                    for event, elem in iterparse_bounded(source)
+                    if event == "end"
+                    and elem.tag == self.W_P
+                    and elem.getparent() is not None
+                )
+            else:
+                # Parse document.xml from the baseline package
+                root = self.original.parse("word/document.xml").getroot()
 
                 # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+                count = len(root.findall(f".//{self.W_P}"))
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -225,35 +245,29 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                # Find w:delText in w:ins that are NOT within w:del
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]",
-                    namespaces=namespaces
-                )
+                # w:delText in w:ins that are NOT within w:del
+                found = self._scan_part(xml_file).found["inserted_deleted_text"]
 
-                for elem in invalid_elements:
+                for line, text in found:
                     text_preview = (
-                        repr(elem.text or "")[:50] + "..."
-                        if len(repr(elem.text or "")) > 50
-                        else repr(elem.text or "")
+                        repr(text)[:50] + "..."
+                        if len(repr(text)) > 50
+                        else repr(text)
                     )
                     errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
+                        f"  {xml_file}: "
+                        f"Line {line}: <w:delText> within <w:ins>: {text_preview}"
                     )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    f"  {xml_file}: Error: {e}"
                 )
 
         if errors:
-            print(f"FAILED - Found {len(errors)} insertion validation violations:")
-            for error in errors:
-                print(error)
+            self._report_errors(
+                f"FAILED - Found {len(errors)} insertion validation violations:", errors
+            )
             return False
         else:
             if self.verbose:
@@ -267,6 +281,8 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         diff = new_count - original_count
         diff_str = f"+{diff}" if diff > 0 else str(diff)
+        if self._check is not None:
+            self._check.details.update(original=original_count, modified=new_count)
         print(f"\nParagraphs: {original_count} → {new_count} ({diff_str})")
 
 
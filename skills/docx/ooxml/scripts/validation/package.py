@@ -0,0 +1,235 @@
+"""
+Read-only access to the parts of an Office package, unpacked or zipped.
+"""
+
+import io
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+
+def open_package(source):
+    """Return a package for source.
+
+    Args:
+        source: An unpacked directory, a .docx/.pptx/.xlsx path, the bytes of
+            such a file, or a package (returned unchanged)
+
+    Returns:
+        DirectoryPackage, ZipPackage or OverlayPackage
+    """
+    if isinstance(source, (DirectoryPackage, ZipPackage, OverlayPackage)):
+        return source
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return ZipPackage(source)
+    if Path(source).is_dir():
+        return DirectoryPackage(source)
+    return ZipPackage(source)
+
+
+class DirectoryPackage:
+    """An unpacked Office document on disk.
+
+    Parts are named by their posix path relative to the directory, as they
+    would be in the zip file.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path).resolve()
+        self.source = self.path
+        self.location = str(self.path)
+        self._names = None
+        self._name_set = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Nothing to release; present for symmetry with ZipPackage."""
+
+    @property
+    def names(self):
+        """Part names, in directory walk order."""
+        if self._names is None:
+            self._names = [
+                path.relative_to(self.path).as_posix()
+                for path in self.path.rglob("*")
+                if path.is_file()
+            ]
+        return self._names
+
+    def __contains__(self, name):
+        if self._name_set is None:
+            self._name_set = set(self.names)
+        return str(name) in self._name_set
+
+    def read(self, name):
+        """Return the raw bytes of a part, or None if it does not exist."""
+        if name not in self:
+            return None
+        return (self.path / str(name)).read_bytes()
+
+    def open(self, name):
+        """Open a part as a binary stream, or return None if it does not exist."""
+        if name not in self:
+            return None
+        return open(self.path / str(name), "rb")
+
+    def parse(self, name):
+        """Parse a part into a new lxml tree, or return None if it does not exist."""
+        if name not in self:
+            return None
+        return lxml.etree.parse(str(self.path / str(name)))
+
+
+class ZipPackage:
+    """A packed Office document, from a file or from bytes in memory.
+
+    The zip is opened on first use and kept open; part bytes are cached, so
+    every part is decompressed at most once.
+    """
+
+    def __init__(self, source):
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self.path = None
+            self.source = bytes(source)
+            self.location = f"<{len(self.source)} bytes>"
+        else:
+            self.path = Path(source)
+            self.source = self.path
+            self.location = str(self.path)
+        self._zip = None
+        self._names = None
+        self._name_set = None
+        self._content = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Close the underlying zip file; cached content stays available."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    @property
+    def zip(self):
+        """The package, opened on first use and kept open."""
+        if self._zip is None:
+            if self.path is None:
+                self._zip = zipfile.ZipFile(io.BytesIO(self.source), "r")
+            else:
+                self._zip = zipfile.ZipFile(self.path, "r")
+        return self._zip
+
+    @property
+    def names(self):
+        """Part names, in archive order."""
+        if self._names is None:
+            self._names = [
+                name for name in self.zip.namelist() if not name.endswith("/")
+            ]
+        return self._names
+
+    def __contains__(self, name):
+        if self._name_set is None:
+            self._name_set = set(self.names)
+        return str(name) in self._name_set
+
+    def read(self, name):
+        """Return the raw bytes of a part, or None if it does not exist."""
+        name = str(name)
+        if name not in self._content:
+            if name not in self:
+                return None
+            self._content[name] = self.zip.read(name)
+        return self._content[name]
+
+    def open(self, name):
+        """Open a part as a binary stream, or return None if it does not exist.
+
+        Parts not read yet are decompressed as the stream is consumed and
+        are not added to the cache.
+        """
+        name = str(name)
+        if name in self._content:
+            return io.BytesIO(self._content[name])
+        if name not in self:
+            return None
+        return self.zip.open(name)
+
+    def parse(self, name):
+        """Parse a part into a new lxml tree, or return None if it does not exist."""
+        content = self.read(name)
+        if content is None:
+            return None
+        return lxml.etree.parse(io.BytesIO(content))
+
+
+class OverlayPackage:
+    """A package with some parts replaced or added from files on disk.
+
+    Lets an editing session over a packed original be validated without
+    writing its unchanged parts out. It has no source to reopen it from, so
+    validators using it check XSD serially whatever their workers setting.
+    """
+
+    def __init__(self, base, overrides):
+        """
+        Args:
+            base: Package the unchanged parts are read from
+            overrides: Dict of part name -> path of the file that replaces it
+        """
+        self.base = base
+        self.overrides = {str(name): Path(path) for name, path in overrides.items()}
+        self.path = None
+        self.source = None
+        self.location = f"{base.location} (+{len(self.overrides)} changed parts)"
+        self._names = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """The base package is owned by the caller and left open."""
+
+    @property
+    def names(self):
+        """Part names, sorted."""
+        if self._names is None:
+            self._names = sorted(set(self.base.names) | self.overrides.keys())
+        return self._names
+
+    def __contains__(self, name):
+        return str(name) in self.overrides or name in self.base
+
+    def read(self, name):
+        """Return the raw bytes of a part, or None if it does not exist."""
+        if str(name) in self.overrides:
+            return self.overrides[str(name)].read_bytes()
+        return self.base.read(name)
+
+    def open(self, name):
+        """Open a part as a binary stream, or return None if it does not exist."""
+        if str(name) in self.overrides:
+            return open(self.overrides[str(name)], "rb")
+        return self.base.open(name)
+
+    def parse(self, name):
+        """Parse a part into a new lxml tree, or return None if it does not exist."""
+        if str(name) in self.overrides:
+            return lxml.etree.parse(str(self.overrides[str(name)]))
+        content = self.base.read(name)
+        if content is None:
+            return None
+        return lxml.etree.parse(io.BytesIO(content))
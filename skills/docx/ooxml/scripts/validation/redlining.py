@@ -2,119 +2,158 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
-import zipfile
-from pathlib import Path
+import difflib
+import re
+import time
+from .baseline import BaselinePackage
+from .package import open_package
+from .report import CheckResult, ValidationReport, peak_rss
+
+# Texts longer than this are diffed word by word instead of per character
+CHAR_DIFF_LIMIT = 5000
+
+# How far past a mismatch to look for paragraphs that agree again, and how
+# many consecutive paragraphs must agree to count as back in sync
+RESYNC_SEARCH_LIMIT = 200
+RESYNC_RUN = 3
+
+# Changed blocks with more paragraph pairs than this are not paired up by similarity
+PAIRING_LIMIT = 400
+
+# Words, runs of whitespace, and single punctuation characters
+WORD_PATTERN = re.compile(r"\w+|\s+|[^\w\s]")
 
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
-        self.unpacked_dir = Path(unpacked_dir)
-        self.original_docx = Path(original_docx)
+    def __init__(self, unpacked_dir, original_docx, verbose=False, authors=("Claude",)):
+        # unpacked_dir may be a directory, a packed file, its bytes, or a package
+        self.package = open_package(unpacked_dir)
+        # original_docx: a path, bytes, or a BaselinePackage shared across validators
+        self.original = BaselinePackage.coerce(original_docx)
+        self.original_docx = self.original.path
         self.verbose = verbose
+        # Authors whose tracked changes are checked (the editing session's authors)
+        self.authors = frozenset(authors)
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
+        # Per-author tracked change counts in the modified document, set by validate():
+        # author -> {"insertions", "deletions", "inserted_chars", "deleted_chars"}
+        self.change_stats = {}
+        # Structured result of validate()
+        self.report = ValidationReport(
+            type(self).__name__, self.package.location, self.original.location
+        )
+        self._check = None
 
     def validate(self):
-        """Main validation method that returns True if valid, False otherwise."""
-        # Verify unpacked directory exists and has correct structure
-        modified_file = self.unpacked_dir / "word" / "document.xml"
-        if not modified_file.exists():
-            print(f"FAILED - Modified document.xml not found at {modified_file}")
+        """Main validation method that returns True if valid, False otherwise.
+
+        The outcome, duration and per-author statistics are also recorded in
+        self.report.
+        """
+        self._check = CheckResult("validate_tracked_changes")
+        self.report.checks.append(self._check)
+        start = time.perf_counter()
+        try:
+            result = self._validate_tracked_changes()
+        finally:
+            self._check.elapsed = time.perf_counter() - start
+            self._check.peak_rss = peak_rss()
+        self._check.status = "passed" if result else "failed"
+        self._check.details["change_stats"] = self.change_stats
+        return result
+
+    def _validate_tracked_changes(self):
+        """Check that all text changes by our authors are tracked."""
+        # Verify the modified package has a main document part
+        modified_content = self.package.read("word/document.xml")
+        if modified_content is None:
+            self._report_failure(
+                f"FAILED - Modified document.xml not found in {self.package.location}"
+            )
             return False
 
-        # First, check if there are any tracked changes by Claude to validate
+        import xml.etree.ElementTree as ET
+
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
-
-        except Exception:
-            # If we can't parse the XML, continue with full validation
-            pass
-
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+            modified_root = ET.fromstring(modified_content)
+        except ET.ParseError as e:
+            self._report_failure(f"FAILED - Error parsing XML files: {e}")
+            return False
+
+        # One pass gives the text without our tracked changes and per-author stats
+        self.change_stats = {}
+        modified_text = self._extract_text_content(modified_root, self.change_stats)
+        if self.verbose:
+            self._print_change_stats()
 
+        # Redlining validation is only needed if our authors made tracked changes
+        if not self.authors & self.change_stats.keys():
             if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
+                print(f"PASSED - No tracked changes by {self._author_names()} found.")
             return True
 
+        # Read original document.xml from the baseline package
+        try:
+            original_content = self.original.read("word/document.xml")
+        except Exception as e:
+            self._report_failure(f"FAILED - Error unpacking original docx: {e}")
+            return False
+
+        if original_content is None:
+            self._report_failure(
+                f"FAILED - Original document.xml not found in {self.original.location}"
+            )
+            return False
+
+        try:
+            original_root = ET.fromstring(original_content)
+        except ET.ParseError as e:
+            self._report_failure(f"FAILED - Error parsing XML files: {e}")
+            return False
+
+        # Compare with the original, also stripped of our tracked changes
+        original_text = self._extract_text_content(original_root)
+
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(original_text, modified_text)
+            self._report_failure(error_message)
+            return False
+
+        if self.verbose:
+            print(
+                f"PASSED - All changes by {self._author_names()} are properly tracked"
+            )
+        return True
+
+    def _report_failure(self, message):
+        """Print a failure message and add it to the report."""
+        print(message)
+        self._check.add_error(
+            message.removeprefix("FAILED - "), file="word/document.xml"
+        )
+
+    def _author_names(self):
+        """Human-readable list of the checked authors."""
+        return ", ".join(sorted(self.authors))
+
+    def _print_change_stats(self):
+        """Print the per-author tracked change statistics."""
+        for author, counts in sorted(self.change_stats.items()):
+            print(
+                f"Tracked changes by {author or '(no author)'}: "
+                f"{counts['insertions']} insertions ({counts['inserted_chars']} chars), "
+                f"{counts['deletions']} deletions ({counts['deleted_chars']} chars)"
+            )
+
     def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        """Generate detailed word-level differences between the two texts."""
         error_parts = [
-            "FAILED - Document text doesn't match after removing Claude's tracked changes",
+            f"FAILED - Document text doesn't match after removing {self._author_names()}'s tracked changes",
             "",
             "Likely causes:",
             "  1. Modified text inside another author's <w:ins> or <w:del> tags",
@@ -127,152 +166,237 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
+        # Show word diff
+        word_diff = self._get_word_diff(original_text, modified_text)
+        if word_diff:
+            error_parts.extend(["Differences:", "============", word_diff])
         else:
-            error_parts.append("Unable to generate word diff (git not available)")
+            error_parts.append("Unable to generate word diff")
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
+    def _get_word_diff(self, original_text, modified_text):
+        """Generate a diff in git's --word-diff=plain format, showing only changed lines.
+
+        Paragraphs are aligned first, so identical paragraphs are skipped with a
+        plain comparison; only the changed blocks are diffed, per character (or
+        per word for very long blocks). Removed text is shown as [-...-] and
+        added text as {+...+}.
+        """
+        original_lines = original_text.split("\n")
+        modified_lines = modified_text.split("\n")
+
+        output = []
+        for i1, i2, j1, j2 in self._changed_blocks(original_lines, modified_lines):
+            output.extend(
+                self._diff_paragraphs(original_lines[i1:i2], modified_lines[j1:j2])
+            )
+
+        return "\n".join(line for line in output if line.strip())
+
+    def _changed_blocks(self, original, modified):
+        """Yield (i1, i2, j1, j2) for each block of paragraphs that differs.
 
+        Walks both lists in step and, at each mismatch, looks for the nearest
+        point where they agree again. Only if that search gives up (a heavily
+        rewritten document) is the remainder aligned with difflib.
+        """
+        i = j = 0
+        while i < len(original) and j < len(modified):
+            if original[i] == modified[j]:
+                i += 1
+                j += 1
+                continue
+            resync = self._find_resync(original, modified, i, j)
+            if resync is None:
+                break
+            yield i, resync[0], j, resync[1]
+            i, j = resync
+
+        if i < len(original) or j < len(modified):
+            matcher = difflib.SequenceMatcher(
+                None, original[i:], modified[j:], autojunk=False
+            )
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag != "equal":
+                    yield i + i1, i + i2, j + j1, j + j2
+
+    def _find_resync(self, original, modified, i, j):
+        """Find the closest (i2, j2) after a mismatch where the paragraphs agree again.
+
+        A match only counts if the next few paragraphs agree as well, so a
+        common short paragraph does not cause a false resync.
+        """
+        for distance in range(1, RESYNC_SEARCH_LIMIT + 1):
+            for skip in range(distance + 1):
+                i2, j2 = i + skip, j + distance - skip
+                if i2 >= len(original) or j2 >= len(modified):
+                    continue
+                if original[i2 : i2 + RESYNC_RUN] == modified[j2 : j2 + RESYNC_RUN]:
+                    return i2, j2
         return None
 
-    def _remove_claude_tracked_changes(self, root):
-        """Remove tracked changes authored by Claude from the XML root."""
-        ins_tag = f"{{{self.namespaces['w']}}}ins"
-        del_tag = f"{{{self.namespaces['w']}}}del"
-        author_attr = f"{{{self.namespaces['w']}}}author"
-
-        # Remove w:ins elements
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == "Claude":
-                    to_remove.append(child)
-            for elem in to_remove:
-                parent.remove(elem)
-
-        # Unwrap content in w:del elements where author is "Claude"
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
-
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
+    def _diff_paragraphs(self, original, modified):
+        """Diff one changed block of paragraphs; returns the marked-up output lines."""
+        if not original:
+            return [f"{{+{line}+}}" for line in modified]
+        if not modified:
+            return [f"[-{line}-]" for line in original]
+        if len(original) * len(modified) > PAIRING_LIMIT:
+            # Too large to pair up by similarity
+            if len(original) == len(modified):
+                return [
+                    line
+                    for old, new in zip(original, modified)
+                    for line in self._diff_text(old, new)
+                ]
+            return self._diff_text("\n".join(original), "\n".join(modified))
+
+        # Pair the most similar paragraphs and recurse on both sides of the pair
+        best_ratio, best_i, best_j = 0.0, 0, 0
+        for i, old in enumerate(original):
+            for j, new in enumerate(modified):
+                matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+                if (
+                    matcher.real_quick_ratio() > best_ratio
+                    and matcher.quick_ratio() > best_ratio
+                ):
+                    ratio = matcher.ratio()
+                    if ratio > best_ratio:
+                        best_ratio, best_i, best_j = ratio, i, j
+        if best_ratio < 0.5:
+            return self._diff_paragraphs(original, []) + self._diff_paragraphs(
+                [], modified
+            )
+        return (
+            self._diff_paragraphs(original[:best_i], modified[:best_j])
+            + self._diff_text(original[best_i], modified[best_j])
+            + self._diff_paragraphs(original[best_i + 1 :], modified[best_j + 1 :])
+        )
+
+    def _diff_text(self, original, modified):
+        """Diff two strings per character (per word when long); returns output lines."""
+        if max(len(original), len(modified)) > CHAR_DIFF_LIMIT:
+            original_tokens = WORD_PATTERN.findall(original)
+            modified_tokens = WORD_PATTERN.findall(modified)
+        else:
+            original_tokens = list(original)
+            modified_tokens = list(modified)
+
+        matcher = difflib.SequenceMatcher(
+            None, original_tokens, modified_tokens, autojunk=False
+        )
+        pieces = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            removed = "".join(original_tokens[i1:i2])
+            added = "".join(modified_tokens[j1:j2])
+            if tag == "equal":
+                pieces.append(added)
+                continue
+            if removed:
+                pieces.append(self._mark(removed, "[-", "-]"))
+            if added:
+                pieces.append(self._mark(added, "{+", "+}"))
+
+        return "".join(pieces).split("\n")
+
+    def _mark(self, text, opening, closing):
+        """Wrap each line of text in diff markers; markers never span a line break."""
+        return "\n".join(
+            f"{opening}{part}{closing}" if part else part for part in text.split("\n")
+        )
+
+    def _extract_text_content(self, root, stats=None):
+        """Extract text content from Word XML as if our tracked changes were removed.
+
+        One walk over the tree drops w:ins elements by self.authors, reads
+        w:delText inside their w:del elements as normal text (unwrapping them),
+        and collects the text of each paragraph. Nested paragraphs (e.g. in text
+        boxes) also contribute to the paragraph that contains them. The tree
+        itself is not modified.
+
+        If a stats dict is given, the same walk fills it with per-author counts
+        of w:ins/w:del elements and of the w:t/w:delText characters inside them,
+        for every author in the document.
 
         Empty paragraphs are skipped to avoid false positives when tracked
         insertions add only structural elements without text content.
         """
-        p_tag = f"{{{self.namespaces['w']}}}p"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
+        w = self.namespaces["w"]
+        p_tag = f"{{{w}}}p"
+        t_tag = f"{{{w}}}t"
+        ins_tag = f"{{{w}}}ins"
+        del_tag = f"{{{w}}}del"
+        deltext_tag = f"{{{w}}}delText"
+        author_attr = f"{{{w}}}author"
+
+        # Text parts per paragraph, in document order of the paragraph starts
         paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
-            # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
-            # Skip empty paragraphs - they don't affect content validation
-            if paragraph_text:
-                paragraphs.append(paragraph_text)
-
-        return "\n".join(paragraphs)
+        # Indices into paragraphs of the w:p elements enclosing the current node
+        open_paragraphs = []
+
+        def author_stats(author):
+            if author not in stats:
+                stats[author] = {
+                    "insertions": 0,
+                    "deletions": 0,
+                    "inserted_chars": 0,
+                    "deleted_chars": 0,
+                }
+            return stats[author]
+
+        # dropped: inside one of our w:ins; in_our_del: inside one of our w:del;
+        # ins_author/del_author: author of the innermost enclosing w:ins/w:del
+        def walk(elem, dropped, in_our_del, ins_author, del_author):
+            for child in elem:
+                tag = child.tag
+                if tag == ins_tag:
+                    author = child.get(author_attr, "")
+                    if stats is not None:
+                        author_stats(author)["insertions"] += 1
+                    walk(
+                        child,
+                        dropped or author in self.authors,
+                        in_our_del,
+                        author,
+                        del_author,
+                    )
+                elif tag == del_tag:
+                    author = child.get(author_attr, "")
+                    if stats is not None:
+                        author_stats(author)["deletions"] += 1
+                    walk(
+                        child,
+                        dropped,
+                        in_our_del or author in self.authors,
+                        ins_author,
+                        author,
+                    )
+                elif tag == p_tag and not dropped:
+                    open_paragraphs.append(len(paragraphs))
+                    paragraphs.append([])
+                    walk(child, dropped, in_our_del, ins_author, del_author)
+                    open_paragraphs.pop()
+                elif tag == t_tag or tag == deltext_tag:
+                    text = child.text
+                    if not text:
+                        continue
+                    if stats is not None:
+                        if tag == t_tag and ins_author is not None:
+                            author_stats(ins_author)["inserted_chars"] += len(text)
+                        elif tag == deltext_tag and del_author is not None:
+                            author_stats(del_author)["deleted_chars"] += len(text)
+                    if not dropped and (tag == t_tag or in_our_del):
+                        for index in open_paragraphs:
+                            paragraphs[index].append(text)
+                else:
+                    walk(child, dropped, in_our_del, ins_author, del_author)
+
+        walk(root, False, False, None, None)
+
+        # Skip empty paragraphs - they don't affect content validation
+        texts = ("".join(parts) for parts in paragraphs)
+        return "\n".join(text for text in texts if text)
 
 
 if __name__ == "__main__":
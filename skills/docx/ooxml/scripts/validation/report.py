@@ -0,0 +1,136 @@
+"""
+Structured, machine-readable results of a validation run.
+"""
+
+import json
+import re
+import sys
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# "  word/document.xml: Line 12: message" or "  word/document.xml: message"
+ERROR_LINE_PATTERN = re.compile(
+    r"^\s*(?P<file>[^\s:]+): (?:Line (?P<line>\d+|None): )?(?P<message>.*)$", re.S
+)
+
+
+def peak_rss():
+    """Peak resident set size of this process so far, in bytes (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _megabytes(size):
+    return None if size is None else round(size / 2**20, 1)
+
+
+class CheckResult:
+    """Outcome of one validation check: status, duration and errors."""
+
+    def __init__(self, name):
+        self.name = name
+        # "passed", "failed", or "info" for checks that only report figures
+        self.status = None
+        self.elapsed = 0.0
+        # Peak RSS of the process when the check finished, in bytes
+        self.peak_rss = None
+        # Dicts with "file" (relative path or None), "line" (int or None), "message"
+        self.errors = []
+        # Check-specific figures, e.g. paragraph counts
+        self.details = {}
+
+    def add_error(self, message, file=None, line=None):
+        """Record one error."""
+        self.errors.append({"file": file, "line": line, "message": message})
+
+    def add_error_lines(self, errors):
+        """Record errors given as the indented lines the checks print.
+
+        File and line number are split off where the line has the usual
+        "path: Line N: message" shape; deeper-indented lines ("    - ...")
+        continue the previous error.
+        """
+        for error in errors:
+            if error.startswith("    ") and self.errors:
+                self.errors[-1]["message"] += "\n" + error.strip()
+                continue
+            match = ERROR_LINE_PATTERN.match(error)
+            if match:
+                line = match["line"]
+                self.add_error(
+                    match["message"],
+                    file=match["file"],
+                    line=int(line) if line and line.isdigit() else None,
+                )
+            else:
+                self.add_error(error.strip())
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "status": self.status,
+            "elapsed_ms": round(self.elapsed * 1000, 3),
+            "peak_rss_mb": _megabytes(self.peak_rss),
+            "errors": self.errors,
+            "details": self.details,
+        }
+
+
+class ValidationReport:
+    """Everything one validator found, for JSON output and aggregation.
+
+    Filled in as the validator runs: one CheckResult per check, in run
+    order, plus hit/miss counters for the caches the validator used.
+    """
+
+    def __init__(self, validator, document, original):
+        self.validator = validator
+        # Where the validated document and its original came from
+        self.document = str(document)
+        self.original = str(original)
+        self.checks = []
+        # cache name -> {"hits": n, "misses": n}
+        self.cache = {}
+
+    @property
+    def passed(self):
+        """False if any check failed."""
+        return all(check.status != "failed" for check in self.checks)
+
+    @property
+    def elapsed(self):
+        """Seconds spent in all checks."""
+        return sum(check.elapsed for check in self.checks)
+
+    @property
+    def peak_rss(self):
+        """Peak RSS of the process after the last check, in bytes (None if unknown)."""
+        sizes = [check.peak_rss for check in self.checks if check.peak_rss]
+        return max(sizes, default=None)
+
+    def count(self, cache, hit):
+        """Count one lookup in the named cache."""
+        counts = self.cache.setdefault(cache, {"hits": 0, "misses": 0})
+        counts["hits" if hit else "misses"] += 1
+
+    def to_dict(self):
+        return {
+            "validator": self.validator,
+            "document": self.document,
+            "original": self.original,
+            "passed": self.passed,
+            "elapsed_ms": round(self.elapsed * 1000, 3),
+            "peak_rss_mb": _megabytes(self.peak_rss),
+            "checks": [check.to_dict() for check in self.checks],
+            "cache": self.cache,
+        }
+
+    def to_json(self, indent=None):
+        """Serialize the report; indent=None gives a single line (NDJSON)."""
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
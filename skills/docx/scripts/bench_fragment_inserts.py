@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark single-run inserts through XMLEditor._parse_fragment.
+
+Usage (from skills/docx):
+    python -m scripts.bench_fragment_inserts
+    python -m scripts.bench_fragment_inserts --inserts 10000 --namespaces 32
+
+Builds a document.xml with --paragraphs single-run paragraphs whose root
+declares --namespaces namespaces, then inserts one run after each of the
+first --inserts runs with DocxXMLEditor.insert_after. The same inserts, and
+_parse_fragment on its own, are also timed with the previous parser, which
+rebuilt the namespace wrapper on every call, parsed it into a throwaway
+document and copied the nodes across with importNode.
+"""
+
+import argparse
+import tempfile
+import time
+import types
+from pathlib import Path
+
+import defusedxml.minidom
+
+from .document import DocxXMLEditor
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+RUN = "<w:r><w:t>run {}</w:t></w:r>"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time single-run inserts with the current and previous parser"
+    )
+    parser.add_argument("--paragraphs", type=int, default=50_000)
+    parser.add_argument("--inserts", type=int, default=10_000)
+    parser.add_argument(
+        "--namespaces",
+        type=int,
+        default=2,
+        help="Namespaces declared on the root element (default: 2)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "document.xml"
+        write_document(path, args.paragraphs, args.namespaces)
+        print(
+            f"{args.inserts} single-run inserts, {args.paragraphs} paragraphs, "
+            f"{args.namespaces} root namespaces"
+        )
+        for label, previous in (("current", False), ("previous", True)):
+            inserts, parses = time_inserts(path, args.inserts, previous)
+            print(
+                f"  {label:<8}: {inserts / args.inserts * 1e6:5.0f} us/insert "
+                f"(_parse_fragment {parses / args.inserts * 1e6:4.0f} us)"
+            )
+
+
+def write_document(path, paragraphs, namespaces):
+    """Write a document.xml whose root declares w plus namespaces - 1 others."""
+    declarations = [f'xmlns:w="{W_NS}"'] + [
+        f'xmlns:ns{i}="urn:example:ns{i}"' for i in range(1, namespaces)
+    ]
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f"<w:document {' '.join(declarations)}><w:body>"
+        + "<w:p><w:r><w:t>text</w:t></w:r></w:p>" * paragraphs
+        + "</w:body></w:document>",
+        encoding="utf-8",
+    )
+
+
+def time_inserts(path, inserts, previous=False):
+    """Time insert_after for each of the first inserts runs, then _parse_fragment alone.
+
+    Returns:
+        tuple: (seconds for the inserts, seconds for as many _parse_fragment calls)
+    """
+    editor = DocxXMLEditor(path, rsid="00AB12CD", author="Reviewer")
+    if previous:
+        editor._parse_fragment = types.MethodType(parse_fragment_previous, editor)
+    runs = editor.dom.getElementsByTagName("w:r")[:inserts]
+
+    start = time.perf_counter()
+    for i, run in enumerate(runs):
+        editor.insert_after(run, RUN.format(i))
+    insert_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(inserts):
+        editor._parse_fragment(RUN.format(i))
+    return insert_seconds, time.perf_counter() - start
+
+
+def parse_fragment_previous(self, xml_content):
+    """The previous XMLEditor._parse_fragment, kept here for comparison."""
+    root_elem = self.dom.documentElement
+    namespaces = []
+    if root_elem and root_elem.attributes:
+        for i in range(root_elem.attributes.length):
+            attr = root_elem.attributes.item(i)
+            if attr.name.startswith("xmlns"):
+                namespaces.append(f'{attr.name}="{attr.value}"')
+
+    wrapper = f"<root {' '.join(namespaces)}>{xml_content}</root>"
+    fragment_doc = defusedxml.minidom.parseString(wrapper)
+    nodes = [
+        self.dom.importNode(child, deep=True)
+        for child in fragment_doc.documentElement.childNodes
+    ]
+    elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+    assert elements, "Fragment must contain at least one element"
+    return nodes
+
+
+if __name__ == "__main__":
+    main()
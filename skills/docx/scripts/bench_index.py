@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark XMLEditor.get_node with and without the lookup index.
+
+Usage (from skills/docx):
+    python -m scripts.bench_index
+    python -m scripts.bench_index --paragraphs 50000 --lookups 600
+
+Builds a synthetic document.xml with one paragraph per line, then times the
+same mix of attribute (w14:paraId) and line-number lookups on an unindexed
+editor and on an indexed one. Building the index, including the lazily built
+w14:paraId attribute index, is timed separately.
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from .utilities import XMLEditor
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NS = "http://schemas.microsoft.com/office/word/2010/wordml"
+# The first paragraph sits on this line of the generated file
+FIRST_LINE = 3
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare indexed and unindexed XMLEditor.get_node lookups"
+    )
+    parser.add_argument("--paragraphs", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "document.xml"
+        write_document(path, args.paragraphs)
+        print(f"{args.paragraphs} paragraphs, {args.lookups} lookups")
+        queries = make_queries(args.paragraphs, args.lookups)
+
+        unindexed = run_lookups(XMLEditor(path), queries)
+        editor = XMLEditor(path)
+        start = time.perf_counter()
+        editor.build_index()
+        editor.get_node(tag="w:p", attrs={"w14:paraId": f"{0:08X}"})
+        build = time.perf_counter() - start
+        indexed = run_lookups(editor, queries)
+
+    print(f"  unindexed: {unindexed * 1000 / len(queries):9.2f} ms/lookup")
+    print(f"  indexed:   {indexed * 1000 / len(queries):9.2f} ms/lookup")
+    print(f"  building the index: {build:.2f}s")
+    print(f"  total: {unindexed:.2f}s unindexed vs {build + indexed:.2f}s indexed")
+
+
+def write_document(path, paragraphs):
+    """Write a document.xml with one w:p per line, each with a unique w14:paraId."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+        f.write(f'<w:document xmlns:w="{W_NS}" xmlns:w14="{W14_NS}"><w:body>\n')
+        for i in range(paragraphs):
+            f.write(
+                f'<w:p w14:paraId="{i:08X}"><w:r><w:t>Paragraph {i}</w:t></w:r></w:p>\n'
+            )
+        f.write("</w:body></w:document>\n")
+
+
+def make_queries(paragraphs, lookups):
+    """Alternate attribute and line lookups for random paragraphs."""
+    rng = random.Random(0)
+    queries = []
+    for i in range(lookups):
+        p = rng.randrange(paragraphs)
+        if i % 2:
+            queries.append({"tag": "w:p", "line_number": FIRST_LINE + p})
+        else:
+            queries.append({"tag": "w:p", "attrs": {"w14:paraId": f"{p:08X}"}})
+    return queries
+
+
+def run_lookups(editor, queries):
+    """Time running every query."""
+    start = time.perf_counter()
+    for query in queries:
+        editor.get_node(**query)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Regression check for the attributes DocxXMLEditor injects into inserted XML.
+
+Usage (from skills/docx):
+    python -m scripts.check_attribute_injection    # exit 1 if any case fails
+
+Covers the nested w:ins/w:del cases that decide between w:rsidDel and w:rsidR
+on runs, and which tracked change IDs are reserved or assigned.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from .document import DocxXMLEditor
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+RSID = "00AB12CD"
+RUN = "<w:r><w:t>x</w:t></w:r>"
+
+# Deep enough to be slow with a per-run ancestor walk, well within minidom's
+# recursion limit when the document is serialized
+SDT_DEPTH = 400
+
+
+def main():
+    failures = check_injection()
+    for failure in failures:
+        print(f"FAILED - {failure}")
+    if failures:
+        sys.exit(1)
+    print("All attribute injection cases passed")
+
+
+def check_injection():
+    """Run every case.
+
+    Returns:
+        list: One message per failed expectation
+    """
+    failures = []
+    for case in (
+        _check_nesting,
+        _check_del_inside_other_authors_ins,
+        _check_smart_tag_run_inside_del,
+        _check_deep_sdt_nest,
+        _check_reserved_ids,
+    ):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for message in case(Path(temp_dir)):
+                failures.append(f"{case.__name__[len('_check_'):]}: {message}")
+    return failures
+
+
+def _editor(temp_dir, body):
+    """Create a DocxXMLEditor on a document.xml with the given w:body content."""
+    path = temp_dir / "document.xml"
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>',
+        encoding="utf-8",
+    )
+    return DocxXMLEditor(path, rsid=RSID, author="Reviewer")
+
+
+def _run_rsids(runs):
+    """Describe how each run is marked: "del" (w:rsidDel only) or "ins" (w:rsidR only)."""
+    marks = []
+    for run in runs:
+        has_del = run.getAttribute("w:rsidDel") == RSID
+        has_ins = run.getAttribute("w:rsidR") == RSID
+        marks.append("del" if has_del and not has_ins else "ins" if has_ins else "?")
+    return marks
+
+
+def _expect(failures, actual, expected, what):
+    if actual != expected:
+        failures.append(f"{what}: expected {expected!r}, got {actual!r}")
+
+
+def _check_nesting(temp_dir):
+    """w:del and w:ins fragments nested both ways."""
+    failures = []
+    editor = _editor(temp_dir, "<w:p/>")
+    para = editor.dom.getElementsByTagName("w:p")[0]
+
+    nodes = editor.append_to(
+        para,
+        f"<w:ins><w:del>{RUN}</w:del>{RUN}</w:ins><w:del><w:ins>{RUN}</w:ins>{RUN}</w:del>",
+    )
+    runs = [r for node in nodes for r in node.getElementsByTagName("w:r")]
+    _expect(failures, _run_rsids(runs), ["del", "ins", "del", "del"], "run marks")
+    return failures
+
+
+def _check_del_inside_other_authors_ins(temp_dir):
+    """A w:del appended into an existing w:ins by another author."""
+    failures = []
+    editor = _editor(
+        temp_dir,
+        '<w:p><w:ins w:id="2" w:author="Other" w:date="2020-01-01T00:00:00Z">'
+        "<w:r><w:t>theirs</w:t></w:r></w:ins>"
+        '<w:del w:id="1" w:author="Other" w:date="2020-01-01T00:00:00Z">'
+        "<w:r><w:delText>gone</w:delText></w:r></w:del></w:p>",
+    )
+    existing_ins = editor.dom.getElementsByTagName("w:ins")[0]
+
+    nodes = editor.append_to(existing_ins, f"<w:del>{RUN}</w:del>{RUN}")
+    new_del = nodes[0]
+    _expect(
+        failures,
+        _run_rsids([new_del.firstChild, nodes[1]]),
+        ["del", "ins"],
+        "run marks",
+    )
+    _expect(failures, new_del.getAttribute("w:author"), "Reviewer", "new w:del author")
+    _expect(failures, new_del.getAttribute("w:id"), "3", "new w:del id")
+    if not new_del.getAttribute("w16du:dateUtc"):
+        failures.append("new w:del has no w16du:dateUtc")
+    _expect(failures, existing_ins.getAttribute("w:author"), "Other", "w:ins author")
+    _expect(failures, existing_ins.getAttribute("w:id"), "2", "w:ins id")
+    return failures
+
+
+def _check_smart_tag_run_inside_del(temp_dir):
+    """A run wrapped in w:smartTag inserted into an existing w:del."""
+    failures = []
+    editor = _editor(
+        temp_dir,
+        '<w:p><w:del w:id="1" w:author="Other" w:date="2020-01-01T00:00:00Z">'
+        "<w:r><w:delText>gone</w:delText></w:r></w:del></w:p>",
+    )
+    existing_del = editor.dom.getElementsByTagName("w:del")[0]
+
+    nodes = editor.append_to(
+        existing_del, "<w:smartTag><w:r><w:delText>s</w:delText></w:r></w:smartTag>"
+    )
+    _expect(
+        failures,
+        _run_rsids(nodes[0].getElementsByTagName("w:r")),
+        ["del"],
+        "smartTag run mark",
+    )
+    nodes = editor.insert_after(existing_del.firstChild, RUN)
+    _expect(failures, _run_rsids(nodes), ["del"], "run next to a deleted run")
+    return failures
+
+
+def _check_deep_sdt_nest(temp_dir):
+    """Runs inserted at the bottom of a deep w:sdt nest, inside and outside a w:del."""
+    failures = []
+    open_tags = "<w:sdt><w:sdtContent>" * SDT_DEPTH
+    close_tags = "</w:sdtContent></w:sdt>" * SDT_DEPTH
+    editor = _editor(
+        temp_dir,
+        f"{open_tags}<w:p><w:r><w:t>deep</w:t></w:r></w:p>{close_tags}"
+        f'<w:p><w:del w:id="1" w:author="Other" w:date="2020-01-01T00:00:00Z">'
+        f"{open_tags}<w:r><w:delText>deep</w:delText></w:r>{close_tags}</w:del></w:p>",
+    )
+    deep_run, deleted_run = editor.dom.getElementsByTagName("w:r")
+
+    nodes = editor.insert_after(deep_run, f"<w:del>{RUN * 3}</w:del>{RUN * 3}")
+    _expect(
+        failures,
+        _run_rsids(nodes[0].childNodes) + _run_rsids(nodes[1:]),
+        ["del"] * 3 + ["ins"] * 3,
+        "runs under the w:sdt nest",
+    )
+
+    nodes = editor.insert_after(deleted_run, RUN)
+    _expect(failures, _run_rsids(nodes), ["del"], "run under the nest inside w:del")
+
+    nodes = editor.insert_after(
+        deep_run, f"<w:del>{open_tags}{RUN}{close_tags}</w:del>"
+    )
+    _expect(
+        failures,
+        _run_rsids(nodes[0].getElementsByTagName("w:r")),
+        ["del"],
+        "run at the bottom of an inserted nest in w:del",
+    )
+    return failures
+
+
+def _check_reserved_ids(temp_dir):
+    """Caller-supplied w:id values are never handed out to new changes."""
+    failures = []
+    editor = _editor(
+        temp_dir,
+        '<w:p><w:ins w:id="4" w:author="Other" w:date="2020-01-01T00:00:00Z">'
+        "<w:r><w:t>theirs</w:t></w:r></w:ins></w:p>",
+    )
+    para = editor.dom.getElementsByTagName("w:p")[0]
+
+    # The auto-assigned w:del comes first in document order
+    nodes = editor.append_to(
+        para, f'<w:del>{RUN}</w:del><w:ins w:id="7">{RUN}</w:ins><w:ins>{RUN}</w:ins>'
+    )
+    _expect(
+        failures,
+        [node.getAttribute("w:id") for node in nodes],
+        ["8", "7", "9"],
+        "change ids",
+    )
+    return failures
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Run the documented Document.batch() examples against a scratch document.
+
+Usage (from skills/docx):
+    python -m scripts.check_batch_example    # exit 1 if an example fails
+
+The example in the Document.batch docstring and the one under "Batched
+Edits" in ooxml.md are extracted as written and run with `doc` and
+`suggestions` defined: each suggestion replaces a run with a tracked
+deletion and insertion. The document must then hold one comment per
+suggestion and save with validation.
+"""
+
+import re
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+from .document import Document
+
+OOXML_MD = Path(__file__).parent.parent / "ooxml.md"
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+PARAGRAPHS = 5
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"><Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/><Default Extension="xml" ContentType="application/xml"/><Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/><Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/></Types>"""
+PACKAGE_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/></Relationships>"""
+DOCUMENT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings" Target="settings.xml"/></Relationships>"""
+SETTINGS = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:settings xmlns:w="{W_NS}"><w:defaultTabStop w:val="720"/></w:settings>"""
+
+
+def main():
+    failures = check_examples()
+    for failure in failures:
+        print(f"FAILED - {failure}")
+    if failures:
+        sys.exit(1)
+    print("All batch examples passed")
+
+
+def check_examples():
+    """Run every documented example.
+
+    Returns:
+        list: One message per failing example
+    """
+    examples = {
+        "Document.batch docstring": _docstring_example(),
+        "ooxml.md Batched Edits": _markdown_example(),
+    }
+    failures = []
+    for name, code in examples.items():
+        if not code:
+            failures.append(f"{name}: example not found")
+            continue
+        with tempfile.TemporaryDirectory() as temp_dir:
+            try:
+                message = _run_example(code, Path(temp_dir))
+            except Exception as e:
+                message = f"{type(e).__name__}: {e}"
+            if message:
+                failures.append(f"{name}: {message}")
+    return failures
+
+
+def _docstring_example():
+    """Get the code under "Example:" in the Document.batch docstring."""
+    doc = Document.batch.__doc__ or ""
+    _, found, example = doc.partition("Example:\n")
+    return textwrap.dedent(example) if found else None
+
+
+def _markdown_example():
+    """Get the first python block in the "Batched Edits" section of ooxml.md."""
+    text = OOXML_MD.read_text(encoding="utf-8")
+    match = re.search(r"### Batched Edits\n.*?```python\n(.*?)```", text, re.DOTALL)
+    return match.group(1) if match else None
+
+
+def _run_example(code, temp_dir):
+    """Run one example on a fresh document; returns a failure message or None."""
+    unpacked = temp_dir / "unpacked"
+    _write_document(unpacked)
+    doc = Document(unpacked)
+    editor = doc["word/document.xml"]
+
+    suggestions = []
+    for i, run in enumerate(editor.dom.getElementsByTagName("w:r")):
+        suggestions.append(
+            (
+                run,
+                f"<w:del><w:r><w:delText>Paragraph {i}</w:delText></w:r></w:del>"
+                f"<w:ins><w:r><w:t>Revised paragraph {i}</w:t></w:r></w:ins>",
+            )
+        )
+
+    exec(code, {"doc": doc, "suggestions": suggestions})
+
+    comments = len(editor.dom.getElementsByTagName("w:commentReference"))
+    if comments != len(suggestions):
+        return f"expected {len(suggestions)} comments, got {comments}"
+    insertions = len(editor.dom.getElementsByTagName("w:ins"))
+    if insertions != len(suggestions):
+        return f"expected {len(suggestions)} insertions, got {insertions}"
+    doc.save(temp_dir / "saved", validate=True)
+    return None
+
+
+def _write_document(unpacked):
+    """Write a minimal unpacked .docx with PARAGRAPHS single-run paragraphs."""
+    paragraphs = "".join(
+        f"<w:p><w:r><w:t>Paragraph {i}</w:t></w:r></w:p>" for i in range(PARAGRAPHS)
+    )
+    files = {
+        "[Content_Types].xml": CONTENT_TYPES,
+        "_rels/.rels": PACKAGE_RELS,
+        "word/_rels/document.xml.rels": DOCUMENT_RELS,
+        "word/document.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<w:document xmlns:w="{W_NS}"><w:body>{paragraphs}<w:sectPr/></w:body>'
+            "</w:document>"
+        ),
+        "word/settings.xml": SETTINGS,
+    }
+    for name, content in files.items():
+        path = unpacked / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ Usage:
     # Initialize
     doc = Document('workspace/unpacked')
     doc = Document('workspace/unpacked', author="John Doe", initials="JD")
+    doc = Document('workspace/report.docx')  # Edit the package directly
 
     # Find nodes
     node = doc["word/document.xml"].get_node(tag="w:del", attrs={"w:id": "1"})
@@ -16,6 +17,13 @@ Usage:
     # Add comments
     doc.add_comment(start=node, end=node, text="Comment text")
     doc.reply_to_comment(parent_comment_id=0, text="Reply text")
+    ids = doc.add_comments([(node, node, "First"), (node, node, "Second")])  # Bulk
+    doc.reply_to_comments([(ids[0], "Reply to first")])
+    doc.find_comments(author="John Doe", paragraph=node)  # IDs from the comment registry
+
+    # Apply many edits as one transaction (all rolled back if one fails)
+    with doc.batch():
+        doc["word/document.xml"].replace_node(node, "<w:r><w:t>new</w:t></w:r>")
 
     # Suggest tracked changes
     doc["word/document.xml"].suggest_deletion(node)  # Delete content
@@ -27,15 +35,21 @@ Usage:
 """
 
 import html
+import os
 import random
 import shutil
+import struct
 import tempfile
-from datetime import datetime, timezone
+import zipfile
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
+from ooxml.scripts.pack import STORED_EXTENSIONS, condense_xml_content, pack_document
+from ooxml.scripts.unpack import pretty_xml_content
+from ooxml.scripts.validation.baseline import BaselinePackage
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
+from ooxml.scripts.validation.package import OverlayPackage
 from ooxml.scripts.validation.redlining import RedliningValidator
 
 from .utilities import XMLEditor
@@ -43,6 +57,26 @@ from .utilities import XMLEditor
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Parts a session always reads or may create, extracted up front for .docx sessions
+PACKAGE_SESSION_PARTS = (
+    "[Content_Types].xml",
+    "word/_rels/document.xml.rels",
+    "word/document.xml",
+    "word/settings.xml",
+    "word/people.xml",
+    "word/comments.xml",
+    "word/commentsExtended.xml",
+    "word/commentsIds.xml",
+    "word/commentsExtensible.xml",
+)
+
+# document.xml elements recorded in the comment registry, by registry key
+COMMENT_MARKERS = {
+    "w:commentRangeStart": "range_start",
+    "w:commentRangeEnd": "range_end",
+    "w:commentReference": "reference",
+}
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -57,7 +91,12 @@ class DocxXMLEditor(XMLEditor):
     """
 
     def __init__(
-        self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
+        self,
+        xml_path,
+        rsid: str,
+        author: str = "Claude",
+        initials: str = "C",
+        indexed: bool = False,
     ):
         """Initialize with required RSID and optional author.
 
@@ -66,52 +105,84 @@ class DocxXMLEditor(XMLEditor):
             rsid: RSID to automatically apply to new elements
             author: Author name for tracked changes and comments (default: "Claude")
             initials: Author initials (default: "C")
+            indexed: If True, build the get_node lookup index (default: False)
         """
-        super().__init__(xml_path)
+        super().__init__(xml_path, indexed=indexed)
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        self._next_change_id = None
+
+    def mark_dirty(self):
+        """Mark the DOM as modified (see XMLEditor.mark_dirty).
+
+        Direct edits may add w:ins/w:del IDs, so the next allocation rescans them.
+        """
+        super().mark_dirty()
+        self._next_change_id = None
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Allocate the next available tracked change ID.
+
+        Existing w:ins and w:del IDs are scanned once on first use; after that IDs
+        are handed out from a counter, kept ahead of caller-supplied IDs by
+        _reserve_change_id.
+        """
+        if self._next_change_id is None:
+            max_id = -1
+            for tag in ("w:ins", "w:del"):
+                elements = self.dom.getElementsByTagName(tag)
+                for elem in elements:
+                    change_id = elem.getAttribute("w:id")
+                    if change_id:
+                        try:
+                            max_id = max(max_id, int(change_id))
+                        except ValueError:
+                            pass
+            self._next_change_id = max_id + 1
+
+        change_id = self._next_change_id
+        self._next_change_id += 1
+        return change_id
+
+    def _reserve_change_id(self, change_id):
+        """Make sure a caller-supplied w:id is never handed out again."""
+        if self._next_change_id is None:
+            return  # Not scanned yet - the first scan will see this ID
+        try:
+            self._next_change_id = max(self._next_change_id, int(change_id) + 1)
+        except ValueError:
+            pass
+
+    def begin_batch(self):
+        """Start queueing edits (see XMLEditor.batch())."""
+        super().begin_batch()
+        self._batch.next_change_id = self._next_change_id
+
+    def rollback_batch(self):
+        """Undo the open batch, including the tracked change IDs it handed out."""
+        batch = self._batch
+        super().rollback_batch()
+        if batch is not None:
+            self._next_change_id = batch.next_change_id
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+        self._declare_namespace(
+            "w16du", "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+        )
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        self._declare_namespace(
+            "w16cex", "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+        )
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        self._declare_namespace(
+            "w14", "http://schemas.microsoft.com/office/word/2010/wordml"
+        )
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -131,9 +202,8 @@ class DocxXMLEditor(XMLEditor):
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        def is_inside_deletion(elem):
-            """Check if element is inside a w:del element."""
-            parent = elem.parentNode
+        def is_inside_deletion(parent):
+            """Check if parent is, or is inside, a w:del element."""
             while parent:
                 if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
                     return True
@@ -155,9 +225,9 @@ class DocxXMLEditor(XMLEditor):
                 self._ensure_w14_namespace()
                 elem.setAttribute("w14:textId", _generate_hex_id())
 
-        def add_rsid_to_r(elem):
+        def add_rsid_to_r(elem, inside_deletion):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
-            if is_inside_deletion(elem):
+            if inside_deletion:
                 if not elem.hasAttribute("w:rsidDel"):
                     elem.setAttribute("w:rsidDel", self.rsid)
             else:
@@ -204,62 +274,58 @@ class DocxXMLEditor(XMLEditor):
                     if not elem.hasAttribute("xml:space"):
                         elem.setAttribute("xml:space", "preserve")
 
-        for node in nodes:
-            if node.nodeType != node.ELEMENT_NODE:
-                continue
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:t": add_xml_space_to_t,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
 
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
-
-    def replace_node(self, elem, new_content):
-        """Replace node with automatic attribute injection."""
-        nodes = super().replace_node(elem, new_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
+        # Whether each insertion point is inside a w:del, looked up once per parent
+        deletion_context = {}
+        for node in nodes:
+            parent = node.parentNode
+            if parent not in deletion_context:
+                deletion_context[parent] = is_inside_deletion(parent)
+
+        # One walk over the nodes and their descendants, in document order,
+        # carrying down whether the current element is inside a w:del
+        tracked = []
+        stack = [
+            (n, deletion_context[n.parentNode])
+            for n in reversed(nodes)
+            if n.nodeType == n.ELEMENT_NODE
+        ]
+        while stack:
+            elem, inside_deletion = stack.pop()
+            tag = elem.tagName
+            if tag == "w:r":
+                add_rsid_to_r(elem, inside_deletion)
+            elif tag in ("w:ins", "w:del"):
+                tracked.append(elem)
+            elif tag in handlers:
+                handlers[tag](elem)
+
+            inside_deletion = inside_deletion or tag == "w:del"
+            stack.extend(
+                (child, inside_deletion)
+                for child in reversed(elem.childNodes)
+                if child.nodeType == child.ELEMENT_NODE
+            )
 
-    def insert_after(self, elem, xml_content):
-        """Insert after with automatic attribute injection."""
-        nodes = super().insert_after(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
+        # Reserve caller-supplied change IDs before auto-assigning any new ones
+        for elem in tracked:
+            if elem.hasAttribute("w:id"):
+                self._reserve_change_id(elem.getAttribute("w:id"))
+        for elem in tracked:
+            add_tracked_change_attrs(elem)
 
-    def insert_before(self, elem, xml_content):
-        """Insert before with automatic attribute injection."""
-        nodes = super().insert_before(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
+        # Re-index so lookups see the injected attributes and any new wrappers
+        self._index_nodes(nodes)
 
-    def append_to(self, elem, xml_content):
-        """Append to with automatic attribute injection."""
-        nodes = super().append_to(elem, xml_content)
+    def _process_inserted_nodes(self, nodes):
+        """Inject attributes into inserted nodes (once per batch inside batch())."""
         self._inject_attributes_to_nodes(nodes)
-        return nodes
 
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
@@ -285,6 +351,9 @@ class DocxXMLEditor(XMLEditor):
             para = doc["word/document.xml"].get_node(tag="w:p", line_number=42)
             doc["word/document.xml"].revert_insertion(para)
         """
+        # Queued batch edits may add insertions under elem
+        self._flush_batch()
+
         # Collect insertions
         ins_elements = []
         if elem.tagName == "w:ins":
@@ -298,6 +367,8 @@ class DocxXMLEditor(XMLEditor):
                 f"revert_insertion requires w:ins elements. "
                 f"The provided element <{elem.tagName}> contains no insertions. "
             )
+        self.dirty = True
+        self._record_for_rollback(elem)
 
         # Process all insertions - wrap all children in w:del
         for ins_elem in ins_elements:
@@ -335,7 +406,7 @@ class DocxXMLEditor(XMLEditor):
             ins_elem.appendChild(del_wrapper)
 
             # Inject attributes to the deletion wrapper
-            self._inject_attributes_to_nodes([del_wrapper])
+            self._nodes_inserted([del_wrapper])
 
         return [elem]
 
@@ -364,6 +435,9 @@ class DocxXMLEditor(XMLEditor):
             para = doc["word/document.xml"].get_node(tag="w:p", line_number=42)
             nodes = doc["word/document.xml"].revert_deletion(para)
         """
+        # Queued batch edits may add deletions under elem
+        self._flush_batch()
+
         # Collect deletions FIRST - before we modify the DOM
         del_elements = []
         is_single_del = elem.tagName == "w:del"
@@ -379,6 +453,7 @@ class DocxXMLEditor(XMLEditor):
                 f"revert_deletion requires w:del elements. "
                 f"The provided element <{elem.tagName}> contains no deletions. "
             )
+        self.dirty = True
 
         # Track created insertion (only relevant if elem is a single w:del)
         created_insertion = None
@@ -418,11 +493,12 @@ class DocxXMLEditor(XMLEditor):
                 ins_elem.appendChild(new_run)
 
             # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+            self._apply_edit("insert_after", del_elem, [ins_elem])
+            self._nodes_inserted([ins_elem])
 
             # If processing a single w:del, track the created insertion
-            if is_single_del and nodes:
-                created_insertion = nodes[0]
+            if is_single_del:
+                created_insertion = ins_elem
 
         # Return based on input type
         if is_single_del and created_insertion:
@@ -495,10 +571,15 @@ class DocxXMLEditor(XMLEditor):
         Raises:
             ValueError: If element has existing tracked changes or invalid structure
         """
+        # Queued batch edits may have changed elem
+        self._flush_batch()
+
         if elem.nodeName == "w:r":
             # Check for existing w:delText
             if elem.getElementsByTagName("w:delText"):
                 raise ValueError("w:r element already contains w:delText")
+            self.dirty = True
+            self._record_for_rollback(elem)
 
             # Convert w:t → w:delText
             for t_elem in list(elem.getElementsByTagName("w:t")):
@@ -527,7 +608,7 @@ class DocxXMLEditor(XMLEditor):
             del_wrapper.appendChild(elem)
 
             # Inject attributes to the deletion wrapper
-            self._inject_attributes_to_nodes([del_wrapper])
+            self._nodes_inserted([del_wrapper])
 
             return del_wrapper
 
@@ -535,6 +616,8 @@ class DocxXMLEditor(XMLEditor):
             # Check for existing tracked changes
             if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
                 raise ValueError("w:p element already contains tracked changes")
+            self.dirty = True
+            self._record_for_rollback(elem)
 
             # Check if it's a numbered list item
             pPr_list = elem.getElementsByTagName("w:pPr")
@@ -585,7 +668,7 @@ class DocxXMLEditor(XMLEditor):
             elem.appendChild(del_wrapper)
 
             # Inject attributes to the deletion wrapper
-            self._inject_attributes_to_nodes([del_wrapper])
+            self._nodes_inserted([del_wrapper])
 
             return elem
 
@@ -609,6 +692,80 @@ def _generate_rsid() -> str:
     return "".join(random.choices("0123456789ABCDEF", k=8))
 
 
+def _copy_zip_member(src, dst, info):
+    """Copy a member from src to dst without recompressing it.
+
+    The compressed bytes are copied as they are, so untouched parts stay
+    byte-identical to the original package.
+    """
+    src.fp.seek(info.header_offset)
+    header = src.fp.read(zipfile.sizeFileHeader)
+    # File name and extra field lengths sit at the end of the local header
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    src.fp.seek(name_length + extra_length, os.SEEK_CUR)
+
+    copied = zipfile.ZipInfo(info.filename, info.date_time)
+    copied.compress_type = info.compress_type
+    copied.external_attr = info.external_attr
+    copied.internal_attr = info.internal_attr
+    copied.create_system = info.create_system
+    # Sizes and CRC are known, so they go in the local header, not a data descriptor
+    copied.flag_bits = info.flag_bits & ~0x08
+    copied.CRC = info.CRC
+    copied.compress_size = info.compress_size
+    copied.file_size = info.file_size
+    zip64 = max(info.file_size, info.compress_size) > zipfile.ZIP64_LIMIT
+
+    dst.fp.seek(dst.start_dir)
+    copied.header_offset = dst.fp.tell()
+    dst.fp.write(copied.FileHeader(zip64))
+    remaining = info.compress_size
+    while remaining:
+        chunk = src.fp.read(min(remaining, 1024 * 1024))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated member in archive: {info.filename}")
+        dst.fp.write(chunk)
+        remaining -= len(chunk)
+    dst.start_dir = dst.fp.tell()
+    dst.filelist.append(copied)
+    dst.NameToInfo[copied.filename] = copied
+
+
+def _find_element(nodes, tag):
+    """Get the first element named tag among nodes, or None."""
+    for node in nodes:
+        if node.nodeType == node.ELEMENT_NODE and node.tagName == tag:
+            return node
+    return None
+
+
+def _marker_paragraph(marker):
+    """Get the w:p a comment marker belongs to, or None.
+
+    A w:commentRangeStart placed directly before a paragraph (as add_comment
+    does for a w:p start) belongs to that paragraph.
+    """
+    if marker is None:
+        return None
+    node = marker.parentNode
+    while node is not None and node.nodeType == node.ELEMENT_NODE:
+        if node.tagName == "w:p":
+            return node
+        node = node.parentNode
+
+    if marker.tagName != "w:commentRangeStart":
+        return None
+    sibling = marker.nextSibling
+    while sibling is not None and (
+        sibling.nodeType != sibling.ELEMENT_NODE
+        or sibling.tagName == "w:commentRangeStart"
+    ):
+        sibling = sibling.nextSibling
+    if sibling is not None and sibling.tagName == "w:p":
+        return sibling
+    return None
+
+
 class Document:
     """Manages comments in unpacked Word documents."""
 
@@ -621,32 +778,71 @@ class Document:
         initials="C",
     ):
         """
-        Initialize with path to unpacked Word document directory.
+        Initialize with path to unpacked Word document directory or .docx file.
         Automatically sets up comment infrastructure (people.xml, RSIDs).
 
+        When given a .docx file, the session works on the package directly: only
+        the XML parts that are accessed are extracted, untouched parts (media,
+        fonts) are streamed through unchanged on save, and the .docx itself is
+        used as the validation baseline.
+
         Args:
             unpacked_dir: Path to unpacked DOCX directory (must contain word/ subdirectory)
+                or to a .docx file
             rsid: Optional RSID to use for all comment elements. If not provided, one will be generated.
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
         """
         self.original_path = Path(unpacked_dir)
+        self.is_package = (
+            self.original_path.is_file()
+            and self.original_path.suffix.lower() == ".docx"
+        )
 
-        if not self.original_path.exists() or not self.original_path.is_dir():
+        if not self.is_package and (
+            not self.original_path.exists() or not self.original_path.is_dir()
+        ):
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
         # Create temporary directory with subdirectories for unpacked content and baseline
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        if self.is_package:
+            # Only parts that are accessed get extracted into unpacked_path;
+            # the package itself is the validation baseline
+            with zipfile.ZipFile(self.original_path) as zf:
+                self._package_parts = set(zf.namelist())
+            self._extracted = {}
+            self.unpacked_path.mkdir()
+            self.original_docx = self.original_path
+            for part in PACKAGE_SESSION_PARTS:
+                self._extract_part(part)
+        else:
+            shutil.copytree(self.original_path, self.unpacked_path)
+
+            # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
+            self.original_docx = Path(self.temp_dir) / "original.docx"
+            pack_document(self.original_path, self.original_docx, validate=False)
+
+            # Track what each save destination already has so only changes are copied
+            self._synced = {self.original_path.resolve(): self._stat_parts()}
 
         self.word_path = self.unpacked_path / "word"
 
+        # Lazily-read view of original_docx, reused across validate() calls
+        self._baseline = None
+
+        # XSD results by (part name, content hash); unchanged parts skip XSD
+        self._xsd_cache = {}
+
+        # Per-author tracked change counts from the last validate()
+        self.change_stats = {}
+
+        # Structured reports (ValidationReport) of the validators run by the last validate()
+        self.validation_reports = []
+
         # Generate RSID if not provided
         self.rsid = rsid if rsid else _generate_rsid()
         print(f"Using RSID: {self.rsid}")
@@ -658,18 +854,26 @@ class Document:
         # Cache for lazy-loaded editors
         self._editors = {}
 
+        # State to restore if the open batch() is rolled back (None outside batch())
+        self._batch_state = None
+
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
         self.comments_extended_path = self.word_path / "commentsExtended.xml"
         self.comments_ids_path = self.word_path / "commentsIds.xml"
         self.comments_extensible_path = self.word_path / "commentsExtensible.xml"
 
-        # Load existing comments and determine next ID (before setup modifies files)
-        self.existing_comments = self._load_existing_comments()
-        self.next_comment_id = self._get_next_comment_id()
+        # Comment registry (ID -> para/durable IDs, author and range markers) and
+        # next ID, read in one pass over the comment parts (before setup modifies files)
+        self.existing_comments, self.next_comment_id = self._load_comments()
+
+        # Marker nodes of comments added this session, resolved on first lookup
+        self._pending_comment_markers = {}
 
         # Convenient access to document.xml editor (semi-private)
         self._document = self["word/document.xml"]
+        if self.existing_comments:
+            self._index_comment_markers()
 
         # Setup tracked changes infrastructure
         self._setup_tracking(track_revisions=track_revisions)
@@ -702,14 +906,97 @@ class Document:
         """
         if xml_path not in self._editors:
             file_path = self.unpacked_path / xml_path
+            if self.is_package:
+                self._extract_part(xml_path)
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
             # Use DocxXMLEditor with RSID, author, and initials for all editors
             self._editors[xml_path] = DocxXMLEditor(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
+            if self._batch_state is not None:
+                self._editors[xml_path].begin_batch()
         return self._editors[xml_path]
 
+    @contextmanager
+    def batch(self):
+        """
+        Apply edits to all parts as one transaction.
+
+        Inside the block, edits made through the editors (replace_node,
+        insert_after, ..., and those made by add_comment and reply_to_comment)
+        are queued. When the block ends, each part parses its queued fragments
+        together and injects RSID, author, date and ID attributes in one pass.
+        Editing methods return empty lists that are filled in at that point.
+        get_node applies the queued edits of its part first.
+
+        If the block raises or an edit cannot be applied, every part, the
+        comment counters and any comment parts created in the block are
+        restored to their state before the batch, and the error is re-raised.
+
+        Raises:
+            ValueError: If a batch is already open
+
+        Comments must be anchored on nodes that stay in the document: a node
+        replaced in the same batch is gone by the time the block ends. Anchor on
+        its paragraph, or on the nodes replace_node returns after the block.
+
+        Example:
+            with doc.batch():
+                for run, replacement in suggestions:
+                    para = run.parentNode  # Stays in the document; run does not
+                    doc["word/document.xml"].replace_node(run, replacement)
+                    doc.add_comment(start=para, end=para, text="Suggested edit")
+        """
+        if self._batch_state is not None:
+            raise ValueError("A batch is already open for this document")
+
+        comment_paths = (
+            self.comments_path,
+            self.comments_extended_path,
+            self.comments_ids_path,
+            self.comments_extensible_path,
+        )
+        self._batch_state = {
+            "editors": set(self._editors),
+            "created": [path for path in comment_paths if not path.exists()],
+            "next_comment_id": self.next_comment_id,
+            "existing_comments": dict(self.existing_comments),
+            "pending_comment_markers": dict(self._pending_comment_markers),
+        }
+        for editor in self._editors.values():
+            editor.begin_batch()
+
+        try:
+            yield self
+            for editor in self._editors.values():
+                editor._flush_batch()
+        except BaseException:
+            self._rollback_batch()
+            raise
+
+        for editor in self._editors.values():
+            editor.commit_batch()
+        self._batch_state = None
+
+    def _rollback_batch(self):
+        """Undo the open batch in every part and restore the comment state."""
+        state = self._batch_state
+        self._batch_state = None
+
+        for xml_path, editor in list(self._editors.items()):
+            if xml_path in state["editors"]:
+                editor.rollback_batch()
+            else:
+                # Opened during the batch: its file is untouched, so reload on next use
+                del self._editors[xml_path]
+        for path in state["created"]:
+            path.unlink(missing_ok=True)
+
+        self.next_comment_id = state["next_comment_id"]
+        self.existing_comments = state["existing_comments"]
+        self._pending_comment_markers = state["pending_comment_markers"]
+
     def add_comment(self, start, end, text: str) -> int:
         """
         Add a comment spanning from one element to another.
@@ -727,40 +1014,29 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
-
-        # If end node is a paragraph, append comment markup inside it
-        # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
-        else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
-
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
+        return self._add_comments([(start, end, text)])[0]
 
-        # Add to commentsExtended.xml immediately
-        self._add_to_comments_extended_xml(para_id, parent_para_id=None)
+    def add_comments(self, comments) -> list:
+        """
+        Add many comments at once.
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        Equivalent to calling add_comment for each entry, but each comment part
+        receives its new entries as a single fragment and the range markers are
+        applied to document.xml together. Runs as a batch() (or within the open
+        one), so either every comment is added or none is.
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        Args:
+            comments: Iterable of (start, end, text) tuples, as for add_comment
 
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+        Returns:
+            The comment IDs that were created, in input order
 
-        self.next_comment_id += 1
-        return comment_id
+        Example:
+            flagged = [p for p in paras if "indemnif" in p.toxml()]
+            doc.add_comments([(p, p, "Review indemnity wording") for p in flagged])
+        """
+        with self._comment_batch():
+            return self._add_comments(comments)
 
     def reply_to_comment(
         self,
@@ -780,58 +1056,89 @@ class Document:
         Example:
             cm.reply_to_comment(parent_comment_id=0, text="I agree with this change")
         """
-        if parent_comment_id not in self.existing_comments:
-            raise ValueError(f"Parent comment with id={parent_comment_id} not found")
+        return self._reply_to_comments([(parent_comment_id, text)])[0]
 
-        parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    def reply_to_comments(self, replies) -> list:
+        """
+        Add many replies at once.
 
-        # Add comment ranges to document.xml immediately
-        parent_start_elem = self._document.get_node(
-            tag="w:commentRangeStart", attrs={"w:id": str(parent_comment_id)}
-        )
-        parent_ref_elem = self._document.get_node(
-            tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
-        )
+        Equivalent to calling reply_to_comment for each entry, with the comment
+        parts and range markers written together as in add_comments. Runs as a
+        batch() (or within the open one), so either every reply is added or none
+        is.
 
-        self._document.insert_after(
-            parent_start_elem, self._comment_range_start_xml(comment_id)
-        )
-        parent_ref_run = parent_ref_elem.parentNode
-        self._document.insert_after(
-            parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
-        )
-        self._document.insert_after(
-            parent_ref_run, self._comment_ref_run_xml(comment_id)
-        )
+        Args:
+            replies: Iterable of (parent_comment_id, text) tuples
 
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
+        Returns:
+            The comment IDs that were created for the replies, in input order
 
-        # Add to commentsExtended.xml immediately (with parent)
-        self._add_to_comments_extended_xml(
-            para_id, parent_para_id=parent_info["para_id"]
-        )
+        Example:
+            legal = doc.find_comments(author="Legal")
+            doc.reply_to_comments([(comment_id, "Accepted") for comment_id in legal])
+        """
+        with self._comment_batch():
+            return self._reply_to_comments(replies)
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+    def get_comment(self, comment_id: int) -> dict:
+        """
+        Look up a comment in the comment registry.
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        Args:
+            comment_id: The w:id of the comment
 
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+        Returns:
+            dict with para_id, durable_id and author, plus range_start and
+            range_end (the w:commentRangeStart/End elements) and reference (the
+            w:r holding w:commentReference). Markers missing from
+            word/document.xml are None.
 
-        self.next_comment_id += 1
-        return comment_id
+        Raises:
+            ValueError: If no comment has this ID
+
+        Example:
+            run = doc.get_comment(0)["reference"]
+        """
+        if comment_id not in self.existing_comments:
+            raise ValueError(f"Comment with id={comment_id} not found")
+        return dict(self._resolve_comment(comment_id))
+
+    def find_comments(self, author=None, paragraph=None) -> list:
+        """
+        List comments by author and/or anchor paragraph.
+
+        Args:
+            author: Only comments written by this author
+            paragraph: Only comments whose range starts or ends in this w:p
+                element (a range start placed directly before it counts)
+
+        Returns:
+            Matching comment IDs in ascending order
+
+        Example:
+            para = doc["word/document.xml"].get_node(tag="w:p", contains="Payment terms")
+            for comment_id in doc.find_comments(author="Claude", paragraph=para):
+                doc.reply_to_comment(comment_id, "Addressed")
+        """
+        matches = []
+        for comment_id in sorted(self.existing_comments):
+            info = self.existing_comments[comment_id]
+            if author is not None and info["author"] != author:
+                continue
+            if paragraph is not None:
+                info = self._resolve_comment(comment_id)
+                if not any(
+                    _marker_paragraph(info[key]) is paragraph
+                    for key in ("range_start", "range_end")
+                ):
+                    continue
+            matches.append(comment_id)
+        return matches
 
     def __del__(self):
         """Clean up temporary directory on deletion."""
+        if getattr(self, "_baseline", None) is not None:
+            self._baseline.close()
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
@@ -842,18 +1149,35 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
+        # The original never changes, so its parsed parts and XSD errors are
+        # kept for the whole session (rebuilt only if the baseline file moved)
+        if self._baseline is None or self._baseline.path != self.original_docx:
+            self._baseline = BaselinePackage(self.original_docx)
+
+        # Package sessions are validated in place: changed parts come from
+        # unpacked_path and everything else straight from the original
+        validation_path = (
+            OverlayPackage(self._baseline, self._changed_session_parts(saved=set()))
+            if self.is_package
+            else self.unpacked_path
+        )
+
         # Create validators with current state
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            validation_path, self._baseline, verbose=False, xsd_cache=self._xsd_cache
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            validation_path, self._baseline, verbose=False, authors={self.author}
         )
 
         # Run validations
+        self.validation_reports = [schema_validator.report]
         if not schema_validator.validate():
             raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
+        self.validation_reports.append(redlining_validator.report)
+        redlining_valid = redlining_validator.validate()
+        self.change_stats = redlining_validator.change_stats
+        if not redlining_valid:
             raise ValueError("Redlining validation failed")
 
     def save(self, destination=None, validate=True) -> None:
@@ -863,56 +1187,232 @@ class Document:
         This persists all changes made via add_comment() and reply_to_comment().
 
         Args:
-            destination: Optional path to save to. If None, saves back to original directory.
+            destination: Optional path to save to. If None, saves back to original
+                directory (or .docx file when the session was opened on a package).
             validate: If True, validates document before saving (default: True).
+
+        Raises:
+            ValueError: If called inside batch()
         """
+        if self._batch_state is not None:
+            raise ValueError("Cannot save while a batch is open")
+
         # Only ensure comment relationships and content types if comment files exist
         if self.comments_path.exists():
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
-        # Save all modified XML files in temp directory
-        for editor in self._editors.values():
-            editor.save()
+        # Save XML files whose DOM was modified (editors that were only read are skipped)
+        saved = set()
+        for xml_path, editor in self._editors.items():
+            if editor.dirty:
+                editor.save()
+                saved.add(xml_path)
 
         # Validate by default
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Copy changed contents from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if self.is_package:
+            self._write_package(target_path, saved)
+        else:
+            self._copy_changed_parts(target_path, saved)
+
+    # ==================== Private: Saving ====================
+
+    def _stat_parts(self):
+        """Snapshot (size, mtime) of every file in unpacked_path, keyed by part name."""
+        parts = {}
+        for file_path in self.unpacked_path.rglob("*"):
+            if file_path.is_file():
+                stat = file_path.stat()
+                parts[file_path.relative_to(self.unpacked_path).as_posix()] = (
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                )
+        return parts
+
+    def _copy_changed_parts(self, target_path, saved):
+        """Copy parts changed since the last sync with target_path.
+
+        A destination that has not been synced before (anything other than the
+        original directory) gets a full copy.
+
+        Args:
+            target_path: Destination directory
+            saved: Part names written by editors during this save
+        """
+        current = self._stat_parts()
+        sync_key = target_path.resolve()
+        synced = self._synced.get(sync_key)
+
+        if synced is None:
+            shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        else:
+            for name, stat in current.items():
+                if name in saved or synced.get(name) != stat:
+                    destination = target_path / name
+                    destination.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(self.unpacked_path / name, destination)
+
+        self._synced[sync_key] = current
+
+    def _changed_session_parts(self, saved):
+        """Get session files that differ from the original package.
+
+        Parts that were only extracted and read are left out so they can be
+        taken from the package unchanged.
+
+        Args:
+            saved: Part names written by editors during this save
+
+        Returns:
+            dict: Part name -> path in unpacked_path
+        """
+        return {
+            name: self.unpacked_path / name
+            for name, stat in self._stat_parts().items()
+            if name in saved or self._extracted.get(name) != stat
+        }
+
+    # ==================== Private: Package Sessions ====================
+
+    def _extract_part(self, part):
+        """Extract a part from the .docx into unpacked_path if not already there.
+
+        XML parts are pretty-printed the same way as unpack.py so line numbers
+        and whitespace match a directory session.
+
+        Returns:
+            bool: True if the part is available in unpacked_path
+        """
+        file_path = self.unpacked_path / part
+        if file_path.exists():
+            return True
+        if part not in self._package_parts:
+            return False
+
+        with zipfile.ZipFile(self.original_docx) as zf:
+            content = zf.read(part)
+        if part.endswith((".xml", ".rels")):
+            content = pretty_xml_content(content)
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+        stat = file_path.stat()
+        self._extracted[part] = (stat.st_size, stat.st_mtime_ns)
+        return True
+
+    def _write_package(self, target_path, saved):
+        """Write the session to a .docx, streaming untouched parts from the original.
+
+        Changed parts in unpacked_path replace (or add to) the original members;
+        their XML is condensed as pack.py would. Everything else is copied across
+        as the original compressed bytes. The package is written to a temporary
+        file next to target_path and then moved over it.
+
+        Args:
+            target_path: Destination .docx file
+            saved: Part names written by editors during this save
+        """
+        if target_path.suffix.lower() != ".docx":
+            raise ValueError(f"{target_path} must be a .docx file")
+
+        session_files = self._changed_session_parts(saved)
+
+        # Write a temporary file next to the target and swap it in with
+        # os.replace, so the target is never missing or half-written
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        output_file = target_path.with_name(f".{target_path.name}.{os.getpid()}.tmp")
+        try:
+            with zipfile.ZipFile(self.original_docx) as src, zipfile.ZipFile(
+                output_file, "w", zipfile.ZIP_DEFLATED
+            ) as dst:
+                for info in src.infolist():
+                    if info.filename in session_files:
+                        self._write_session_part(
+                            dst, info.filename, session_files.pop(info.filename)
+                        )
+                    elif info.is_dir():
+                        dst.writestr(info, b"")
+                    else:
+                        _copy_zip_member(src, dst, info)
+
+                # New parts created during the session (comments, people.xml, media)
+                for name in sorted(session_files):
+                    self._write_session_part(dst, name, session_files[name])
+
+            if target_path.exists():
+                shutil.copymode(target_path, output_file)
+                # Keep the baseline stable when saving over the package it came from
+                if target_path.samefile(self.original_docx):
+                    self._keep_baseline()
+
+            os.replace(output_file, target_path)
+        except BaseException:
+            output_file.unlink(missing_ok=True)
+            raise
+
+    def _keep_baseline(self):
+        """Keep the original package in temp_dir as the baseline before it is replaced.
+
+        A hard link keeps the original bytes without copying them; a copy is
+        made where linking is not possible. The original path is left in place.
+        """
+        baseline = Path(self.temp_dir) / "original.docx"
+        if self._baseline is not None:
+            self._baseline.close()
+            self._baseline = None
+        try:
+            os.link(self.original_docx, baseline)
+        except OSError:
+            shutil.copy2(self.original_docx, baseline)
+        self.original_docx = baseline
+
+    def _write_session_part(self, dst, name, file_path):
+        """Write one session file into the output package the way pack.py would."""
+        if name.endswith((".xml", ".rels")):
+            zinfo = zipfile.ZipInfo.from_file(file_path, name)
+            content = condense_xml_content(file_path.read_bytes())
+            dst.writestr(zinfo, content, compress_type=zipfile.ZIP_DEFLATED)
+        elif file_path.suffix.lower() in STORED_EXTENSIONS:
+            dst.write(file_path, name, compress_type=zipfile.ZIP_STORED)
+        else:
+            dst.write(file_path, name)
 
     # ==================== Private: Initialization ====================
 
-    def _get_next_comment_id(self):
-        """Get the next available comment ID."""
-        if not self.comments_path.exists():
-            return 0
+    def _load_comments(self):
+        """Build the comment registry from comments.xml and commentsIds.xml.
 
-        editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
-
-    def _load_existing_comments(self):
-        """Load existing comments from files to enable replies."""
+        Range markers are filled in afterwards by _index_comment_markers.
+
+        Returns:
+            tuple: (registry, next_comment_id)
+        """
         if not self.comments_path.exists():
-            return {}
+            return {}, 0
+
+        durable_ids = {}
+        if self.comments_ids_path.exists():
+            editor = self["word/commentsIds.xml"]
+            for elem in editor.dom.getElementsByTagName("w16cid:commentId"):
+                durable_ids[elem.getAttribute("w16cid:paraId")] = elem.getAttribute(
+                    "w16cid:durableId"
+                )
 
         editor = self["word/comments.xml"]
-        existing = {}
+        registry = {}
+        max_id = -1
 
         for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if not comment_id:
+            try:
+                comment_id = int(comment_elem.getAttribute("w:id"))
+            except ValueError:
                 continue
+            max_id = max(max_id, comment_id)
 
             # Find para_id from the w:p element within the comment
             para_id = None
@@ -921,12 +1421,206 @@ class Document:
                 if para_id:
                     break
 
-            if not para_id:
+            registry[comment_id] = {
+                "para_id": para_id or None,
+                "durable_id": durable_ids.get(para_id),
+                "author": comment_elem.getAttribute("w:author"),
+                "range_start": None,
+                "range_end": None,
+                "reference": None,
+            }
+
+        return registry, max_id + 1
+
+    # ==================== Private: Adding Comments ====================
+
+    def _comment_batch(self):
+        """Get a context that applies bulk comment edits as one transaction."""
+        return self.batch() if self._batch_state is None else nullcontext()
+
+    def _add_comments(self, comments):
+        """Add comments spanning (start, end) ranges; see add_comments."""
+        new_comments = []
+        for start, end, text in comments:
+            comment_id = self.next_comment_id
+
+            # Add comment ranges to document.xml immediately
+            start_nodes = self._document.insert_before(
+                start, self._comment_range_start_xml(comment_id)
+            )
+
+            # If end node is a paragraph, append comment markup inside it
+            # Otherwise insert after it (for run-level anchors)
+            if end.tagName == "w:p":
+                end_nodes = self._document.append_to(
+                    end, self._comment_range_end_xml(comment_id)
+                )
+            else:
+                end_nodes = self._document.insert_after(
+                    end, self._comment_range_end_xml(comment_id)
+                )
+
+            new_comments.append(
+                self._new_comment(text, None, (start_nodes, end_nodes, end_nodes))
+            )
+
+        self._write_comments(new_comments)
+        return [comment["id"] for comment in new_comments]
+
+    def _reply_to_comments(self, replies):
+        """Add replies to registered comments; see reply_to_comments."""
+        new_comments = []
+        for parent_comment_id, text in replies:
+            if parent_comment_id not in self.existing_comments:
+                raise ValueError(
+                    f"Parent comment with id={parent_comment_id} not found"
+                )
+
+            parent_info = self._resolve_comment(parent_comment_id)
+            if not parent_info["para_id"]:
+                raise ValueError(
+                    f"Parent comment with id={parent_comment_id} has no w14:paraId"
+                )
+            parent_start_elem = parent_info["range_start"]
+            parent_ref_run = parent_info["reference"]
+            if parent_start_elem is None or parent_ref_run is None:
+                raise ValueError(
+                    f"Range of parent comment with id={parent_comment_id} not found "
+                    "in word/document.xml"
+                )
+
+            comment_id = self.next_comment_id
+
+            # Add comment ranges to document.xml immediately
+            start_nodes = self._document.insert_after(
+                parent_start_elem, self._comment_range_start_xml(comment_id)
+            )
+            end_nodes = self._document.insert_after(
+                parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
+            )
+            reference_nodes = self._document.insert_after(
+                parent_ref_run, self._comment_ref_run_xml(comment_id)
+            )
+
+            new_comments.append(
+                self._new_comment(
+                    text,
+                    parent_info["para_id"],
+                    (start_nodes, end_nodes, reference_nodes),
+                )
+            )
+
+        self._write_comments(new_comments)
+        return [comment["id"] for comment in new_comments]
+
+    def _new_comment(self, text, parent_para_id, markers):
+        """Allocate IDs for a comment whose range markers were just inserted.
+
+        The comment is registered right away so later entries of the same bulk
+        call can reply to it.
+
+        Returns:
+            dict: The comment's id, para_id, durable_id, parent_para_id and text
+        """
+        comment = {
+            "id": self.next_comment_id,
+            "para_id": _generate_hex_id(),
+            "durable_id": _generate_hex_id(),
+            "parent_para_id": parent_para_id,
+            "text": text,
+        }
+        self._register_comment(
+            comment["id"], comment["para_id"], comment["durable_id"], markers
+        )
+        self.next_comment_id += 1
+        return comment
+
+    def _write_comments(self, comments):
+        """Add comments to the four comment parts, one fragment per part."""
+        if not comments:
+            return
+
+        # Add to comments.xml immediately
+        self._add_to_comments_xml(comments)
+
+        # Add to commentsExtended.xml immediately (with parents for replies)
+        self._add_to_comments_extended_xml(comments)
+
+        # Add to commentsIds.xml immediately
+        self._add_to_comments_ids_xml(comments)
+
+        # Add to commentsExtensible.xml immediately
+        self._add_to_comments_extensible_xml(comments)
+
+    # ==================== Private: Comment Registry ====================
+
+    def _index_comment_markers(self):
+        """Record every comment's range markers and reference run in one pass."""
+        self._document._flush_batch()
+        self._pending_comment_markers = {}
+        for info in self.existing_comments.values():
+            info.update(range_start=None, range_end=None, reference=None)
+
+        stack = [self._document.dom.documentElement]
+        while stack:
+            elem = stack.pop()
+            key = COMMENT_MARKERS.get(elem.tagName)
+            if key is None:
+                stack.extend(
+                    child
+                    for child in reversed(elem.childNodes)
+                    if child.nodeType == child.ELEMENT_NODE
+                )
+                continue
+            try:
+                info = self.existing_comments.get(int(elem.getAttribute("w:id")))
+            except ValueError:
                 continue
+            if info is not None and info[key] is None:
+                info[key] = elem.parentNode if key == "reference" else elem
 
-            existing[int(comment_id)] = {"para_id": para_id}
+    def _register_comment(self, comment_id, para_id, durable_id, markers):
+        """Add a comment created this session to the registry.
 
-        return existing
+        Args:
+            markers: (range start, range end, reference run) node lists returned
+                by the edits; inside a batch they are filled when it is applied
+        """
+        self.existing_comments[comment_id] = {
+            "para_id": para_id,
+            "durable_id": durable_id,
+            "author": self.author,
+            "range_start": None,
+            "range_end": None,
+            "reference": None,
+        }
+        self._pending_comment_markers[comment_id] = markers
+
+    def _resolve_comment(self, comment_id):
+        """Get a registry entry with its markers resolved to live document nodes."""
+        info = self.existing_comments[comment_id]
+
+        markers = self._pending_comment_markers.pop(comment_id, None)
+        if markers is not None:
+            if not all(markers):
+                # Still queued in the open batch
+                self._document._flush_batch()
+            start_nodes, end_nodes, reference_nodes = markers
+            info["range_start"] = _find_element(start_nodes, "w:commentRangeStart")
+            info["range_end"] = _find_element(end_nodes, "w:commentRangeEnd")
+            info["reference"] = _find_element(reference_nodes, "w:r")
+
+        # Direct edits (replace_node, ...) may have detached the indexed markers
+        dom = self._document.dom
+        for key in ("range_start", "range_end", "reference"):
+            node = info[key]
+            while node is not None and node is not dom:
+                node = node.parentNode
+            if info[key] is not None and node is None:
+                self._index_comment_markers()
+                break
+
+        return info
 
     # ==================== Private: Setup Methods ====================
 
@@ -1065,67 +1759,81 @@ class Document:
 
     # ==================== Private: XML File Creation ====================
 
-    def _add_to_comments_xml(
-        self, comment_id, para_id, text, author, initials, timestamp
-    ):
-        """Add a single comment to comments.xml."""
+    def _add_to_comments_xml(self, comments):
+        """Add comments to comments.xml as a single fragment."""
         if not self.comments_path.exists():
             shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
 
         editor = self["word/comments.xml"]
-        root = editor.get_node(tag="w:comments")
+        root = editor.dom.documentElement
 
-        escaped_text = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        )
         # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
         # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
-  <w:p w14:paraId="{para_id}" w14:textId="77777777">
+        xml = []
+        for comment in comments:
+            escaped_text = (
+                comment["text"]
+                .replace("&", "&amp;")
+                .replace("<", "&lt;")
+                .replace(">", "&gt;")
+            )
+            xml.append(f'''<w:comment w:id="{comment["id"]}">
+  <w:p w14:paraId="{comment["para_id"]}" w14:textId="77777777">
     <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
     <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
   </w:p>
-</w:comment>'''
-        editor.append_to(root, comment_xml)
+</w:comment>''')
+        editor.append_to(root, "".join(xml))
 
-    def _add_to_comments_extended_xml(self, para_id, parent_para_id):
-        """Add a single comment to commentsExtended.xml."""
+    def _add_to_comments_extended_xml(self, comments):
+        """Add comments to commentsExtended.xml as a single fragment."""
         if not self.comments_extended_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
             )
 
         editor = self["word/commentsExtended.xml"]
-        root = editor.get_node(tag="w15:commentsEx")
+        root = editor.dom.documentElement
 
-        if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
-        else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
+        xml = []
+        for comment in comments:
+            para_id, parent_para_id = comment["para_id"], comment["parent_para_id"]
+            if parent_para_id:
+                xml.append(
+                    f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
+                )
+            else:
+                xml.append(f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>')
+        editor.append_to(root, "".join(xml))
 
-    def _add_to_comments_ids_xml(self, para_id, durable_id):
-        """Add a single comment to commentsIds.xml."""
+    def _add_to_comments_ids_xml(self, comments):
+        """Add comments to commentsIds.xml as a single fragment."""
         if not self.comments_ids_path.exists():
             shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
-        root = editor.get_node(tag="w16cid:commentsIds")
+        root = editor.dom.documentElement
 
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cid:commentId w16cid:paraId="{comment["para_id"]}" w16cid:durableId="{comment["durable_id"]}"/>'
+            for comment in comments
+        )
         editor.append_to(root, xml)
 
-    def _add_to_comments_extensible_xml(self, durable_id):
-        """Add a single comment to commentsExtensible.xml."""
+    def _add_to_comments_extensible_xml(self, comments):
+        """Add comments to commentsExtensible.xml as a single fragment."""
         if not self.comments_extensible_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
             )
 
         editor = self["word/commentsExtensible.xml"]
-        root = editor.get_node(tag="w16cex:commentsExtensible")
+        root = editor.dom.documentElement
 
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cex:commentExtensible w16cex:durableId="{comment["durable_id"]}"/>'
+            for comment in comments
+        )
         editor.append_to(root, xml)
 
     # ==================== Private: XML Fragments ====================
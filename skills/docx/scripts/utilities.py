@@ -22,6 +22,14 @@ Example usage:
     # Combine filters
     elem = editor.get_node(tag="w:p", line_number=range(1, 50), contains="text")
 
+    # Opt in to indexed lookups when running many queries against a large file
+    editor.build_index()
+
+    # Queue many edits and apply them together (rolled back if any fails)
+    with editor.batch():
+        editor.insert_after(elem, "<w:r><w:t>one</w:t></w:r>")
+        editor.insert_after(elem, "<w:r><w:t>two</w:t></w:r>")
+
     # Replace, insert, or manipulate
     new_elem = editor.replace_node(elem, "<w:r><w:t>new text</w:t></w:r>")
     editor.insert_after(new_elem, "<w:r><w:t>more</w:t></w:r>")
@@ -30,10 +38,13 @@ Example usage:
     editor.save()
 """
 
+import bisect
 import html
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Union
 
+import defusedxml.expatbuilder
 import defusedxml.minidom
 import defusedxml.sax
 
@@ -50,14 +61,16 @@ class XMLEditor:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+        dirty: True if the DOM was modified since it was loaded or last saved
     """
 
-    def __init__(self, xml_path):
+    def __init__(self, xml_path, indexed: bool = False):
         """
         Initialize with path to XML file and parse with line number tracking.
 
         Args:
             xml_path: Path to XML file to edit (str or Path)
+            indexed: If True, build the lookup index used by get_node (default: False)
 
         Raises:
             ValueError: If the XML file does not exist
@@ -72,6 +85,176 @@ class XMLEditor:
 
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self.dirty = False
+
+        # Lookup index (None while indexing is disabled)
+        self._tag_index = None
+        self._attr_index = None
+        self._line_index = None
+        self._line_keys = None
+        self._index_stale = False
+        if indexed:
+            self.build_index()
+
+        # Open edit batch (None outside batch())
+        self._batch = None
+
+        # Wrapper start tag declaring the root's namespaces, built on first use
+        self._namespace_prelude = None
+        self._fragment_builder = None
+
+    def mark_dirty(self):
+        """
+        Mark the DOM as modified after manipulating it directly.
+
+        The editing methods do this automatically. Call it after changing
+        self.dom by hand so the file is saved, the root's namespace declarations
+        are re-read before the next fragment is parsed and, if enabled, the lookup
+        index is rebuilt before the next get_node.
+
+        Example:
+            node.parentNode.removeChild(node)
+            editor.mark_dirty()
+        """
+        self.dirty = True
+        self._namespace_prelude = None
+        if self._tag_index is not None:
+            self._index_stale = True
+
+    def build_index(self):
+        """
+        Build (or rebuild) the lookup index used by get_node.
+
+        The index maps tag -> elements, (tag, attribute, value) -> elements and
+        tag -> original line number -> elements, so attribute and line lookups no
+        longer scan the whole document. It is kept up to date by replace_node,
+        insert_before, insert_after and append_to. Call this again after mutating
+        the DOM directly.
+
+        Example:
+            editor.build_index()
+            elem = editor.get_node(tag="w:del", attrs={"w:id": "1"})
+        """
+        self._tag_index = {}
+        self._attr_index = {}
+        self._line_index = {}
+        self._line_keys = {}
+        self._index_stale = False
+        self._index_nodes([self.dom.documentElement])
+
+    @contextmanager
+    def batch(self):
+        """
+        Apply edits as one transaction.
+
+        Inside the block replace_node, insert_before, insert_after and append_to
+        only queue their edit and return an empty list. When the block ends, all
+        queued fragments are parsed together, applied in order, and the returned
+        lists are filled with the inserted nodes. If the block raises or an edit
+        cannot be applied, every edit made in the batch is undone and the error
+        is re-raised.
+
+        get_node applies the queued edits first, so lookups always see them.
+
+        Example:
+            with editor.batch():
+                for elem, xml in edits:
+                    editor.replace_node(elem, xml)
+        """
+        self.begin_batch()
+        try:
+            yield self
+            self._flush_batch()
+        except BaseException:
+            self.rollback_batch()
+            raise
+        self.commit_batch()
+
+    def begin_batch(self):
+        """
+        Start queueing edits (see batch()); end with commit_batch or rollback_batch.
+
+        Raises:
+            ValueError: If a batch is already open
+        """
+        if self._batch is not None:
+            raise ValueError("A batch is already open for this editor")
+        self._batch = _EditBatch(self)
+
+    def commit_batch(self):
+        """Apply the queued edits and close the batch."""
+        self._flush_batch()
+        self._batch = None
+
+    def rollback_batch(self):
+        """Discard the queued edits, undo the applied ones and close the batch."""
+        batch = self._batch
+        if batch is None:
+            return
+        self._batch = None
+
+        for action, node, arg in reversed(batch.undo):
+            if action == "inserted":
+                if node.parentNode is not None:
+                    node.parentNode.removeChild(node)
+            elif action == "removed":
+                parent, next_sibling = arg
+                parent.insertBefore(node, next_sibling)
+            elif action == "restored":
+                for elem, children, attrs in arg:
+                    while elem.firstChild:
+                        elem.removeChild(elem.firstChild)
+                    for child in children:
+                        elem.appendChild(child)
+                    for name in list(elem.attributes.keys()):
+                        if name not in attrs:
+                            elem.removeAttribute(name)
+                    for name, value in attrs.items():
+                        elem.setAttribute(name, value)
+
+        root = self.dom.documentElement
+        for name in list(root.attributes.keys()):  # type: ignore
+            if name.startswith("xmlns") and name not in batch.namespaces:
+                root.removeAttribute(name)  # type: ignore
+                self._namespace_prelude = None
+
+        self.dirty = batch.dirty
+        if self._tag_index is not None:
+            self._index_stale = True
+
+    def _flush_batch(self):
+        """
+        Apply the edits queued in the open batch.
+
+        Fragments are parsed with a single wrapper parse, applied in queue order,
+        and the inserted nodes are passed to _process_inserted_nodes together.
+        """
+        batch = self._batch
+        if batch is None or not (batch.pending or batch.inserted):
+            return
+
+        pending, batch.pending = batch.pending, []
+        parsed = self._parse_fragments([edit[2] for edit in pending])
+        # Inserts grouped by the parent they land in, placed per parent at once
+        inserts = {}
+        for (action, elem, _, result), nodes in zip(pending, parsed):
+            if elem.parentNode is None:
+                raise ValueError(
+                    f"Cannot {action} <{elem.nodeName}>: it is no longer in the document"
+                )
+            if action == "replace":
+                # elem leaves the tree, so inserts queued around it go in first
+                self._apply_inserts(inserts)
+                self._apply_edit(action, elem, nodes)
+            else:
+                parent = elem if action == "append" else elem.parentNode
+                inserts.setdefault(parent, []).append((action, elem, nodes))
+            result.extend(nodes)
+            batch.inserted.extend(nodes)
+        self._apply_inserts(inserts)
+
+        inserted, batch.inserted = batch.inserted, []
+        self._process_inserted_nodes(inserted)
 
     def get_node(
         self,
@@ -109,8 +292,14 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
+        self._flush_batch()
+        indexed = self._tag_index is not None
         matches = []
-        for elem in self.dom.getElementsByTagName(tag):
+        for elem in self._get_candidates(tag, attrs, line_number):
+            # Skip index entries for elements no longer in the document
+            if indexed and not self._is_attached(elem):
+                continue
+
             # Check line_number filter
             if line_number is not None:
                 parse_pos = getattr(elem, "parse_position", (None,))
@@ -180,6 +369,110 @@ class XMLEditor:
             )
         return matches[0]
 
+    def _get_candidates(self, tag, attrs, line_number):
+        """
+        Get the elements that get_node should filter for a query.
+
+        Without an index this is every element with the tag. With an index the
+        smallest candidate set is picked from the attribute or line index; the
+        caller still applies all filters, so stale entries are harmless.
+        """
+        if self._tag_index is None:
+            return self.dom.getElementsByTagName(tag)
+        if self._index_stale:
+            self.build_index()
+
+        if attrs:
+            candidate_sets = [
+                self._get_attr_candidates(tag, attr_name, attr_value)
+                for attr_name, attr_value in attrs.items()
+            ]
+            return list(min(candidate_sets, key=len))
+
+        if line_number is not None:
+            by_line = self._line_index.get(tag, {})  # type: ignore
+            if not isinstance(line_number, range):
+                return list(by_line.get(line_number, ()))
+
+            if tag not in self._line_keys:  # type: ignore
+                self._line_keys[tag] = sorted(by_line)  # type: ignore
+            keys = self._line_keys[tag]  # type: ignore
+            if line_number.step == 1:
+                lo = bisect.bisect_left(keys, line_number.start)
+                hi = bisect.bisect_left(keys, line_number.stop)
+                lines = keys[lo:hi]
+            else:
+                lines = [line for line in keys if line in line_number]
+            return [elem for line in lines for elem in by_line[line]]
+
+        return list(self._tag_index.get(tag, ()))
+
+    def _get_attr_candidates(self, tag, attr_name, attr_value):
+        """Get indexed elements with a given attribute value, indexing the attribute on first use."""
+        by_attr = self._attr_index.setdefault(tag, {})  # type: ignore
+        if attr_name not in by_attr:
+            values = {}
+            for elem in self._tag_index.get(tag, ()):  # type: ignore
+                values.setdefault(elem.getAttribute(attr_name), {})[elem] = None
+            by_attr[attr_name] = values
+        return by_attr[attr_name].get(attr_value, {})
+
+    def _index_nodes(self, nodes):
+        """Add nodes and all their descendant elements to the lookup index."""
+        if self._tag_index is None:
+            return
+
+        stack = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+        while stack:
+            elem = stack.pop()
+            tag = elem.tagName
+            self._tag_index.setdefault(tag, {})[elem] = None
+
+            for attr_name, values in self._attr_index.get(tag, {}).items():  # type: ignore
+                values.setdefault(elem.getAttribute(attr_name), {})[elem] = None
+
+            parse_pos = getattr(elem, "parse_position", None)
+            if parse_pos is not None:
+                by_line = self._line_index.setdefault(tag, {})  # type: ignore
+                by_line.setdefault(parse_pos[0], {})[elem] = None
+                self._line_keys.pop(tag, None)  # type: ignore
+
+            stack.extend(
+                child
+                for child in elem.childNodes
+                if child.nodeType == child.ELEMENT_NODE
+            )
+
+    def _unindex_nodes(self, nodes):
+        """Remove nodes and all their descendant elements from the lookup index."""
+        if self._tag_index is None:
+            return
+
+        stack = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+        while stack:
+            elem = stack.pop()
+            tag = elem.tagName
+            self._tag_index.get(tag, {}).pop(elem, None)
+
+            for attr_name, values in self._attr_index.get(tag, {}).items():  # type: ignore
+                values.get(elem.getAttribute(attr_name), {}).pop(elem, None)
+
+            parse_pos = getattr(elem, "parse_position", None)
+            if parse_pos is not None:
+                self._line_index.get(tag, {}).get(parse_pos[0], {}).pop(elem, None)  # type: ignore
+
+            stack.extend(
+                child
+                for child in elem.childNodes
+                if child.nodeType == child.ELEMENT_NODE
+            )
+
+    def _is_attached(self, node):
+        """Check whether a node is still part of this editor's document."""
+        while node.parentNode is not None:
+            node = node.parentNode
+        return node is self.dom
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
@@ -217,12 +510,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.replace_node(old_elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(new_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        parent.removeChild(elem)
-        return nodes
+        return self._edit("replace", elem, new_content)
 
     def insert_after(self, elem, xml_content):
         """
@@ -238,15 +526,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_after(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        next_sibling = elem.nextSibling
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            if next_sibling:
-                parent.insertBefore(node, next_sibling)
-            else:
-                parent.appendChild(node)
-        return nodes
+        return self._edit("insert_after", elem, xml_content)
 
     def insert_before(self, elem, xml_content):
         """
@@ -262,11 +542,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_before(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        return nodes
+        return self._edit("insert_before", elem, xml_content)
 
     def append_to(self, elem, xml_content):
         """
@@ -282,11 +558,109 @@ class XMLEditor:
         Example:
             new_nodes = editor.append_to(elem, "<w:r><w:t>text</w:t></w:r>")
         """
+        return self._edit("append", elem, xml_content)
+
+    def _edit(self, action, elem, xml_content):
+        """Parse and apply one edit, or queue it while a batch is open."""
+        if self._batch is not None:
+            nodes = []
+            self._batch.pending.append((action, elem, xml_content, nodes))
+            self.dirty = True
+            return nodes
+
         nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            elem.appendChild(node)
+        self._apply_edit(action, elem, nodes)
+        self._process_inserted_nodes(nodes)
         return nodes
 
+    def _apply_edit(self, action, elem, nodes):
+        """
+        Place already-imported nodes relative to elem.
+
+        Args:
+            action: "replace", "insert_after", "insert_before" or "append"
+            elem: Element the nodes are placed relative to
+            nodes: Nodes belonging to this document
+        """
+        self.dirty = True
+        if action == "append":
+            for node in nodes:
+                elem.appendChild(node)
+        else:
+            parent = elem.parentNode
+            anchor = elem.nextSibling if action == "insert_after" else elem
+            for node in nodes:
+                parent.insertBefore(node, anchor)
+            if action == "replace":
+                parent.removeChild(elem)
+                self._unindex_nodes([elem])
+                if self._batch is not None:
+                    self._batch.undo.append(
+                        ("removed", elem, (parent, nodes[-1].nextSibling))
+                    )
+
+        if self._batch is not None:
+            self._batch.undo.extend(("inserted", node, None) for node in nodes)
+
+    def _apply_inserts(self, inserts):
+        """
+        Apply queued insert_before, insert_after and append edits and clear them.
+
+        Args:
+            inserts: Parent -> list of (action, elem, nodes) in queue order
+        """
+        for parent, edits in inserts.items():
+            if len(edits) < _SPLICE_MIN_EDITS:
+                for action, elem, nodes in edits:
+                    self._apply_edit(action, elem, nodes)
+                continue
+
+            self.dirty = True
+            nodes = _splice_children(parent, edits)
+            # As minidom's insertBefore does
+            self.dom._id_cache.clear()
+            self.dom._id_search_stack = None
+            if self._batch is not None:
+                self._batch.undo.extend(("inserted", node, None) for node in nodes)
+        inserts.clear()
+
+    def _nodes_inserted(self, nodes):
+        """
+        Run _process_inserted_nodes on nodes added outside _edit.
+
+        Inside a batch this is deferred and done together with the batch's other
+        inserted nodes.
+        """
+        if self._batch is not None:
+            self._batch.inserted.extend(nodes)
+        else:
+            self._process_inserted_nodes(nodes)
+
+    def _process_inserted_nodes(self, nodes):
+        """Hook run on newly inserted nodes; subclasses add attribute injection."""
+        self._index_nodes(nodes)
+
+    def _record_for_rollback(self, elem):
+        """
+        Record elem's subtree and its place in the parent before changing them in place.
+
+        A rollback puts the same node objects back with their children and
+        attribute values as they are now. Does nothing outside a batch.
+        """
+        if self._batch is None:
+            return
+        nodes = [elem.parentNode]
+        stack = [elem]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(c for c in node.childNodes if c.nodeType == c.ELEMENT_NODE)
+        state = [
+            (node, list(node.childNodes), dict(node.attributes.items()))
+            for node in nodes
+        ]
+        self._batch.undo.append(("restored", None, state))
+
     def get_next_rid(self):
         """Get the next available rId for relationships files."""
         max_id = 0
@@ -308,40 +682,211 @@ class XMLEditor:
         """
         content = self.dom.toxml(encoding=self.encoding)
         self.xml_path.write_bytes(content)
+        self.dirty = False
+
+    def _parse_fragments(self, contents):
+        """
+        Parse several XML fragments with one wrapper parse.
+
+        Args:
+            contents: List of strings containing XML fragments
+
+        Returns:
+            List with the nodes of each fragment, in order
+        """
+        if len(contents) == 1:
+            return [self._parse_fragment(contents[0])]
+
+        wrapper = "".join(
+            f"<{_FRAGMENT_TAG}>{content}</{_FRAGMENT_TAG}>" for content in contents
+        )
+        try:
+            containers = self._parse_fragment(wrapper)
+        except Exception:
+            containers = None
+        if containers is None or len(containers) != len(contents):
+            # Report the error against the fragment that caused it
+            return [self._parse_fragment(xml_content) for xml_content in contents]
+
+        parsed = []
+        for container in containers:
+            nodes = _detach_children(container)
+            elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+            assert elements, "Fragment must contain at least one element"
+            parsed.append(nodes)
+        return parsed
 
     def _parse_fragment(self, xml_content):
         """
-        Parse XML fragment and return list of imported nodes.
+        Parse XML fragment and return list of nodes created in this document.
+
+        The fragment is parsed inside a wrapper element declaring the root's
+        namespaces, with its nodes built directly in self.dom.
 
         Args:
             xml_content: String containing XML fragment
 
         Returns:
-            List of defusedxml.minidom.Node objects imported into this document
+            List of defusedxml.minidom.Node objects belonging to this document
 
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
-
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
-        fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
-        ]
+        if self._namespace_prelude is None:
+            # Namespace declarations of the root document element
+            root_elem = self.dom.documentElement
+            namespaces = []
+            if root_elem and root_elem.attributes:
+                for i in range(root_elem.attributes.length):
+                    attr = root_elem.attributes.item(i)
+                    if attr.name.startswith("xmlns"):  # type: ignore
+                        namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
+            self._namespace_prelude = f"<root {' '.join(namespaces)}>"
+
+        if self._fragment_builder is None:
+            self._fragment_builder = _FragmentBuilder(self.dom)
+        nodes = self._fragment_builder.parse_children(
+            f"{self._namespace_prelude}{xml_content}</root>"
+        )
         elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
         assert elements, "Fragment must contain at least one element"
         return nodes
 
+    def _declare_namespace(self, prefix, uri):
+        """Declare xmlns:prefix on the root element if it is not declared yet."""
+        root = self.dom.documentElement
+        if not root.hasAttribute(f"xmlns:{prefix}"):  # type: ignore
+            root.setAttribute(f"xmlns:{prefix}", uri)  # type: ignore
+            self._namespace_prelude = None
+
+
+# Wraps each fragment when a batch parses its fragments together
+_FRAGMENT_TAG = "xml-editor-fragment"
+
+# Queued inserts under one parent from which a single-pass splice beats
+# minidom's insertBefore, which looks each anchor up with childNodes.index
+_SPLICE_MIN_EDITS = 8
+
+
+class _EditBatch:
+    """Queued edits and undo log of an XMLEditor batch."""
+
+    def __init__(self, editor):
+        # (action, element, xml_content, returned node list) per queued edit
+        self.pending = []
+        # Nodes inserted but not yet passed to _process_inserted_nodes
+        self.inserted = []
+        # (action, node, arg) per applied change, undone in reverse by rollback
+        self.undo = []
+        self.dirty = editor.dirty
+        root = editor.dom.documentElement
+        self.namespaces = {
+            name for name in root.attributes.keys() if name.startswith("xmlns")
+        }
+
+
+class _FragmentBuilder(defusedxml.expatbuilder.DefusedExpatBuilderNS):
+    """
+    Expat DOM builder that creates a fragment's nodes directly in an existing document.
+
+    This saves building a throwaway document and copying every node into the
+    target with importNode.
+    """
+
+    def __init__(self, document):
+        self._target = document
+        super().__init__()
+
+    def reset(self):
+        # As ExpatBuilderNS.reset, without creating a new document each time
+        self.document = self._target
+        self.curNode = self._target.createDocumentFragment()
+        self._elem_info = self._target._elem_info
+        self._cdata = False
+        self._initNamespaces()
+
+    def first_element_handler(self, name, attributes):
+        # The wrapper's namespace declarations are only needed by expat itself
+        del self._ns_ordered_prefixes[:]
+        super().first_element_handler(name, attributes)
+
+    def parse_children(self, xml):
+        """Parse a single wrapper element and return its child nodes, detached."""
+        container = self.curNode
+        try:
+            self.parseString(xml)
+        except Exception:
+            # parseString only resets after a successful parse; the failed expat
+            # parser and the half-built fragment must not be reused
+            self._parser = None
+            self.reset()
+            raise
+        return _detach_children(container.firstChild)
+
+
+def _splice_children(parent, edits):
+    """
+    Place the nodes of several inserts under one parent in a single pass.
+
+    The children end up in the same order as applying the edits one at a time,
+    without a childNodes.index lookup per inserted node.
+
+    Args:
+        parent: Element all edits insert into
+        edits: (action, elem, nodes) in queue order; action is "insert_before",
+            "insert_after" (elem is a child of parent) or "append" (elem is parent)
+
+    Returns:
+        list: The inserted nodes
+    """
+    before, after, tail = {}, {}, []
+    for action, elem, nodes in edits:
+        if action == "insert_before":
+            before.setdefault(elem, []).extend(nodes)
+        elif action == "insert_after":
+            # Each insert_after lands directly after elem, ahead of earlier ones
+            after[elem] = nodes + after.get(elem, [])
+        else:
+            tail.extend(nodes)
+
+    children = []
+    positions = []
+    for child in parent.childNodes:
+        nodes = before.get(child)
+        if nodes:
+            positions.extend(range(len(children), len(children) + len(nodes)))
+            children.extend(nodes)
+        children.append(child)
+        nodes = after.get(child)
+        if nodes:
+            positions.extend(range(len(children), len(children) + len(nodes)))
+            children.extend(nodes)
+    positions.extend(range(len(children), len(children) + len(tail)))
+    children.extend(tail)
+
+    # Only the inserted nodes and their neighbours need new sibling links
+    last = len(children) - 1
+    for i in positions:
+        node = children[i]
+        node.parentNode = parent
+        node.previousSibling = children[i - 1] if i else None
+        node.nextSibling = children[i + 1] if i < last else None
+        if i:
+            children[i - 1].nextSibling = node
+        if i < last:
+            children[i + 1].previousSibling = node
+
+    parent.childNodes[:] = children
+    return [children[i] for i in positions]
+
+
+def _detach_children(parent):
+    """Unlink and return the child nodes of a node that is about to be discarded."""
+    nodes = list(parent.childNodes)
+    for node in nodes:
+        node.parentNode = node.previousSibling = node.nextSibling = None
+    return nodes
+
 
 def _create_line_tracking_parser():
     """